@@ -1,13 +1,16 @@
 # actual_reasoning_engine.py
+import os
 import math
 import time
 import random
 from collections import defaultdict
+from history_spill import BoundedHistory, HistorySpill
+from query_profiler import profiled
 
 print("🧠 BUILDING ACTUAL REASONING ENGINE...")
 
 class DodecahedronReasoner:
-    def __init__(self):
+    def __init__(self, reasoning_paths=None):
         # 12 reasoning domains (faces)
         self.domains = {
             'mathematical': "Numerical and logical reasoning",
@@ -30,8 +33,8 @@ class DodecahedronReasoner:
         # Knowledge base
         self.knowledge_graph = defaultdict(list)
         
-        # Track reasoning paths
-        self.reasoning_paths = []
+        # Track reasoning paths (bounded in memory, optionally spilled to disk)
+        self.reasoning_paths = reasoning_paths if reasoning_paths is not None else BoundedHistory()
         
     def analyze_question(self, question):
         """Actually analyze the question structure and intent"""
@@ -228,11 +231,18 @@ class DodecahedronReasoner:
 
 # ===== ENHANCED SYSTEM WITH ACTUAL REASONING =====
 class ActualReasoningEngine:
-    def __init__(self):
+    def __init__(self, history_size=1000, spill_dir=None, spill_max_bytes=64 * 1024 * 1024):
         print("🧠 INITIALIZING DODECAHEDRON REASONING ENGINE...")
-        self.reasoner = DodecahedronReasoner()
-        self.conversation_history = []
+        conversation_spill = None
+        paths_spill = None
+        if spill_dir:
+            conversation_spill = HistorySpill(os.path.join(spill_dir, "conversation.jsonl"), max_bytes=spill_max_bytes)
+            paths_spill = HistorySpill(os.path.join(spill_dir, "reasoning_paths.jsonl"), max_bytes=spill_max_bytes)
+            
+        self.reasoner = DodecahedronReasoner(BoundedHistory(history_size, paths_spill))
+        self.conversation_history = BoundedHistory(history_size, conversation_spill)
         
+    @profiled
     def ask(self, question):
         """Process question with actual reasoning"""
         if not question.strip():
@@ -246,6 +256,11 @@ class ActualReasoningEngine:
         self.conversation_history.append(f"System: {answer}")
         return answer
     
+    def close(self):
+        """Flush and stop the history writers"""
+        self.conversation_history.close()
+        self.reasoner.reasoning_paths.close()
+    
     def show_reasoning_capabilities(self):
         """Demonstrate the actual reasoning abilities"""
         test_questions = [
@@ -6,6 +6,7 @@ import numpy as np
 from pathlib import Path
 from collections import defaultdict, deque
 import hashlib
+from query_profiler import profiled
 
 print("🧠 INITIALIZING ALGORITHMIC MATRIX REASONING ENGINE...")
 
@@ -323,6 +324,7 @@ class AlgorithmicReasoningEngine:
         self.five_teams = FiveTeamArchitecture()
         self.session_id = 0
         
+    @profiled
     def process_query(self, query):
         """Main processing interface"""
         self.session_id += 1
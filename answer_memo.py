@@ -0,0 +1,150 @@
+# answer_memo.py
+import hashlib
+import json
+import os
+import sqlite3
+import threading
+import time
+
+
+class AnswerMemoStore:
+    """Persistent answer cache shared by every process on one host"""
+
+    def __init__(self, path="answer_memo.sqlite3", max_entries=100000, timeout=30.0, touch_batch=256):
+        self.path = path
+        self.max_entries = max_entries
+        self.timeout = timeout
+        self._local = threading.local()
+        # Cache hits only note their time here; last_used is written in batches, not per hit
+        self.touch_batch = touch_batch
+        self._touched = {}
+        self._touch_lock = threading.Lock()
+        self._puts_since_count = 0
+        self._approx_rows = None
+
+        conn = self._connection()
+        conn.execute(
+            "CREATE TABLE IF NOT EXISTS answers ("
+            " key TEXT PRIMARY KEY,"
+            " stamp TEXT NOT NULL,"
+            " answer TEXT NOT NULL,"
+            " created REAL NOT NULL,"
+            " last_used REAL NOT NULL)"
+        )
+        conn.execute("CREATE INDEX IF NOT EXISTS answers_last_used ON answers (last_used)")
+
+    def _connection(self):
+        """One sqlite connection per thread, WAL mode so readers never block writers"""
+        conn = getattr(self._local, 'conn', None)
+        if conn is None or getattr(self._local, 'pid', None) != os.getpid():
+            conn = sqlite3.connect(self.path, timeout=self.timeout, isolation_level=None)
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute("PRAGMA synchronous=NORMAL")
+            self._local.conn = conn
+            self._local.pid = os.getpid()
+        return conn
+
+    @staticmethod
+    def normalize_question(question):
+        """Collapse case and whitespace so trivial variants share an entry"""
+        return " ".join(question.lower().split())
+
+    @staticmethod
+    def version_stamp(engine_name, knowledge):
+        """Stamp an engine with a digest of its knowledge so edits invalidate old answers"""
+        payload = json.dumps(knowledge, sort_keys=True, default=str)
+        return f"{engine_name}:{hashlib.sha256(payload.encode()).hexdigest()[:16]}"
+
+    def make_key(self, question, stamp):
+        normalized = self.normalize_question(question)
+        return hashlib.sha256(f"{stamp}\0{normalized}".encode()).hexdigest()
+
+    def get(self, question, stamp):
+        """Return the memoized answer or None"""
+        key = self.make_key(question, stamp)
+        conn = self._connection()
+        row = conn.execute("SELECT answer FROM answers WHERE key = ?", (key,)).fetchone()
+        if row is None:
+            return None
+        with self._touch_lock:
+            self._touched[key] = time.time()
+            full = len(self._touched) >= self.touch_batch
+        if full:
+            self.flush_touches()
+        return json.loads(row[0])
+
+    def flush_touches(self):
+        """Write the pending last_used updates from cache hits in one transaction"""
+        with self._touch_lock:
+            touched, self._touched = self._touched, {}
+        if not touched:
+            return
+        conn = self._connection()
+        conn.execute("BEGIN IMMEDIATE")
+        try:
+            conn.executemany("UPDATE answers SET last_used = MAX(last_used, ?) WHERE key = ?",
+                             [(used, key) for key, used in touched.items()])
+            conn.execute("COMMIT")
+        except Exception:
+            conn.execute("ROLLBACK")
+            raise
+
+    def put(self, question, stamp, answer):
+        """Store an answer; compacts when the table grows past max_entries"""
+        key = self.make_key(question, stamp)
+        now = time.time()
+        conn = self._connection()
+        conn.execute(
+            "INSERT OR REPLACE INTO answers (key, stamp, answer, created, last_used) VALUES (?, ?, ?, ?, ?)",
+            (key, stamp, json.dumps(answer), now, now)
+        )
+        if not self.max_entries:
+            return
+        # COUNT(*) is a table scan, so track the row count locally and recount only past the
+        # bound (or every few hundred puts, to see rows other processes added)
+        self._puts_since_count += 1
+        if self._approx_rows is None or self._puts_since_count >= 256:
+            self._approx_rows = self.count()
+            self._puts_since_count = 0
+        else:
+            self._approx_rows += 1
+        if self._approx_rows > self.max_entries:
+            self._approx_rows = self.count()
+            self._puts_since_count = 0
+            if self._approx_rows > self.max_entries:
+                # Evict below the bound so a full cache doesn't compact on every put
+                self._approx_rows = self.compact(max(1, int(self.max_entries * 0.9)))
+
+    def count(self):
+        return self._connection().execute("SELECT COUNT(*) FROM answers").fetchone()[0]
+
+    def compact(self, max_entries=None, live_stamps=None):
+        """Drop stale-stamp entries and evict least recently used rows down to max_entries"""
+        limit = max_entries if max_entries is not None else self.max_entries
+        # Recency from recent hits must land before eviction picks the least recently used
+        self.flush_touches()
+        conn = self._connection()
+        conn.execute("BEGIN IMMEDIATE")
+        try:
+            if live_stamps:
+                marks = ",".join("?" for _ in live_stamps)
+                conn.execute(f"DELETE FROM answers WHERE stamp NOT IN ({marks})", tuple(live_stamps))
+            if limit:
+                conn.execute(
+                    "DELETE FROM answers WHERE key IN ("
+                    " SELECT key FROM answers ORDER BY last_used DESC LIMIT -1 OFFSET ?)",
+                    (limit,)
+                )
+            conn.execute("COMMIT")
+        except Exception:
+            conn.execute("ROLLBACK")
+            raise
+        conn.execute("PRAGMA wal_checkpoint(TRUNCATE)")
+        return self.count()
+
+    def close(self):
+        self.flush_touches()
+        conn = getattr(self._local, 'conn', None)
+        if conn is not None:
+            conn.close()
+            self._local.conn = None
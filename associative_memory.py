@@ -0,0 +1,117 @@
+# associative_memory.py
+import re
+import zlib
+
+import numpy as np
+
+WORD_RE = re.compile(r"[a-z0-9']+")
+
+
+def text_vectors(texts, dim=256):
+    """Signed feature-hashed word + character-trigram vectors, L2-normalized, float32 (len(texts), dim)"""
+    rows = []
+    cols = []
+    signs = []
+    for row, text in enumerate(texts):
+        text = text.lower()
+        features = WORD_RE.findall(text)
+        padded = f" {' '.join(features)} "
+        features += [padded[i:i + 3] for i in range(len(padded) - 2)]
+        for feature in features:
+            h = zlib.crc32(feature.encode('utf-8'))
+            rows.append(row)
+            cols.append(h % dim)
+            signs.append(1.0 if h & 0x80000000 else -1.0)
+
+    vectors = np.zeros((len(texts), dim), dtype=np.float32)
+    np.add.at(vectors, (np.array(rows, dtype=np.intp), np.array(cols, dtype=np.intp)),
+              np.array(signs, dtype=np.float32))
+    return normalize_rows(vectors)
+
+
+def normalize_rows(vectors):
+    norms = np.linalg.norm(vectors, axis=1, keepdims=True)
+    return vectors / np.maximum(norms, 1e-12)
+
+
+class AssociativeMemory:
+    """Content-addressable memory: a softmax (dense) Hopfield network over float32 pattern slots"""
+
+    def __init__(self, slots=64, dim=256, beta=128.0, max_iterations=10, tolerance=1e-4, block_cells=1 << 22):
+        self.slots = slots
+        self.dim = dim
+        # Unit vectors of related questions sit within a few hundredths of each other in cosine;
+        # a sharp inverse temperature keeps their basins apart instead of blending them
+        self.beta = beta
+        self.max_iterations = max_iterations
+        self.tolerance = tolerance
+        self.block_cells = block_cells  # queries × slots scored at once, bounds scratch memory
+
+        self.patterns = np.zeros((slots, dim), dtype=np.float32)
+        self.payloads = [None] * slots
+        self.count = 0
+        self.next_slot = 0
+
+    def __len__(self):
+        return self.count
+
+    def store(self, vectors, payloads=None):
+        """Write patterns into the next slots (oldest overwritten once full); returns the slot indices"""
+        vectors = normalize_rows(np.atleast_2d(np.asarray(vectors, dtype=np.float32)))
+        if payloads is None:
+            payloads = [None] * len(vectors)
+        slots = (self.next_slot + np.arange(len(vectors))) % self.slots
+        self.patterns[slots] = vectors
+        for slot, payload in zip(slots.tolist(), payloads):
+            self.payloads[slot] = payload
+        self.next_slot = int((self.next_slot + len(vectors)) % self.slots)
+        self.count = min(self.slots, self.count + len(vectors))
+        return slots
+
+    def attention(self, states, patterns):
+        """Softmax weights of each state over the stored patterns"""
+        scores = states @ patterns.T
+        scores *= self.beta
+        scores -= scores.max(axis=1, keepdims=True)
+        np.exp(scores, out=scores)
+        scores /= scores.sum(axis=1, keepdims=True)
+        return scores
+
+    def converge(self, queries):
+        """Iterate ξ ← normalize(softmax(β ξ Xᵀ) X) until no state moves more than tolerance
+
+        Returns the settled states and how many iterations were needed.
+        """
+        patterns = self.patterns[:self.count]
+        states = normalize_rows(np.asarray(queries, dtype=np.float32))
+        iterations = 0
+        active = np.arange(len(states))
+        while iterations < self.max_iterations and len(active):
+            iterations += 1
+            updated = normalize_rows(self.attention(states[active], patterns) @ patterns)
+            moved = np.abs(updated - states[active]).max(axis=1)
+            states[active] = updated
+            # Settled queries drop out so later iterations only pay for the stragglers
+            active = active[moved > self.tolerance]
+        return states, iterations
+
+    def recall(self, queries):
+        """Nearest stored slot for each query row: (slots, query-to-slot cosine similarities, settled states)"""
+        queries = np.atleast_2d(np.asarray(queries, dtype=np.float32))
+        if self.count == 0:
+            return (np.full(len(queries), -1, dtype=np.intp), np.zeros(len(queries), dtype=np.float32),
+                    normalize_rows(queries))
+
+        block = max(1, self.block_cells // self.count)
+        slots = np.empty(len(queries), dtype=np.intp)
+        similarity = np.empty(len(queries), dtype=np.float32)
+        settled = np.empty((len(queries), self.dim), dtype=np.float32)
+        patterns = self.patterns[:self.count]
+        for start in range(0, len(queries), block):
+            block_queries = normalize_rows(queries[start:start + block])
+            states, _ = self.converge(block_queries)
+            best = (states @ patterns.T).argmax(axis=1)
+            slots[start:start + block] = best
+            similarity[start:start + block] = np.einsum('ij,ij->i', block_queries, patterns[best])
+            settled[start:start + block] = states
+        return slots, similarity, settled
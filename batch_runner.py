@@ -0,0 +1,276 @@
+# batch_runner.py
+import argparse
+import contextlib
+import importlib
+import json
+import os
+import threading
+import time
+from collections import deque
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
+
+from worker_pool import WorkerPool
+
+# name: (module, class, entry method)
+ENGINES = {
+    'working': ('working_reasoning', 'WorkingReasoner', 'answer_question'),
+    'proper': ('proper_reasoning_engine', 'ReasoningEngine', 'ask'),
+    'actual': ('actual_reasoning_engine', 'ActualReasoningEngine', 'ask'),
+    'algorithmic': ('algorithmic_reasoning', 'AlgorithmicReasoningEngine', 'process_query'),
+    'true': ('true_algorithmic_reasoning', 'TrueReasoningEngine', 'process'),
+    'debug': ('debug_reasoning', 'DebugReasoner', 'process_question'),
+    'divine': ('divine_system_complete', 'DivineSystemIntegrator', 'ask_question'),
+    'simple': ('simple_start', 'SimpleDivineInterface', 'ask_question'),
+}
+
+QUESTION_FIELDS = ('question', 'query', 'prompt', 'text', 'body', 'title')
+
+
+def resolve_engine(spec):
+    """'working' or 'module:Class.method' → (engine class, method name)"""
+    if spec in ENGINES:
+        module, cls, method = ENGINES[spec]
+    else:
+        module, _, rest = spec.partition(':')
+        cls, _, method = rest.partition('.')
+        if not (module and cls and method):
+            raise ValueError(f"Unknown engine {spec!r}: use one of {sorted(ENGINES)} or module:Class.method")
+    return getattr(importlib.import_module(module), cls), method
+
+
+def extract_question(record, field=None):
+    if isinstance(record, str):
+        return record
+    if field is not None:
+        return record[field]
+    for name in QUESTION_FIELDS:
+        if name in record:
+            return record[name]
+    raise KeyError(f"No question field in record (tried {', '.join(QUESTION_FIELDS)})")
+
+
+class Checkpoint:
+    """Resume point, rewritten atomically: every line before next_line is in the output, plus done_beyond"""
+
+    def __init__(self, path):
+        self.path = path
+
+    def load(self):
+        if not os.path.exists(self.path):
+            return None
+        with open(self.path) as f:
+            return json.load(f)
+
+    def save(self, state):
+        tmp = f"{self.path}.tmp"
+        with open(tmp, 'w') as f:
+            json.dump(state, f)
+        os.replace(tmp, self.path)
+
+
+class BatchRunner:
+    """Streams a JSONL file of questions through an engine with bounded in-flight concurrency
+
+    At most max_in_flight questions are read ahead of the output, so
+    memory stays constant however large the input is. Ordered mode writes
+    results in input order; unordered mode writes each result as soon as
+    it is ready. Progress is checkpointed next to the output, and a rerun
+    truncates any partial tail and continues from the last checkpoint.
+    """
+
+    def __init__(self, engine='working', concurrency=4, max_in_flight=None, ordered=True, field=None,
+                 processes=False, checkpoint_every=100, checkpoint_seconds=5.0):
+        self.engine_class, self.method = resolve_engine(engine)
+        self.concurrency = concurrency
+        self.max_in_flight = max_in_flight or 4 * concurrency
+        self.ordered = ordered
+        self.field = field
+        self.processes = processes
+        self.checkpoint_every = checkpoint_every
+        self.checkpoint_seconds = checkpoint_seconds
+        self.local = threading.local()
+
+    def thread_engine(self):
+        """One engine instance per worker thread (engines keep per-session state)"""
+        engine = getattr(self.local, 'engine', None)
+        if engine is None:
+            engine = self.local.engine = self.engine_class()
+        return engine
+
+    def answer(self, question):
+        return getattr(self.thread_engine(), self.method)(question)
+
+    def read_lines(self, path, offset, line_number):
+        """(line number, byte offset after the line, raw line) from offset onwards"""
+        with open(path, 'rb') as f:
+            f.seek(offset)
+            for raw in f:
+                offset += len(raw)
+                yield line_number, offset, raw
+                line_number += 1
+
+    def make_result(self, line_number, record, future):
+        result = {'line': line_number}
+        if isinstance(record, dict):
+            for key in ('id', 'request_id'):
+                if key in record:
+                    result[key] = record[key]
+        try:
+            result['answer'] = future.result()
+        except Exception as e:
+            result['error'] = f"{type(e).__name__}: {e}"
+        return result
+
+    def run(self, input_path, output_path, resume=True, quiet=False):
+        """Process input_path into output_path; returns counters for the run"""
+        checkpoint = Checkpoint(f"{output_path}.ckpt")
+        state = checkpoint.load() if resume else None
+        if state is None:
+            state = {'input_offset': 0, 'next_line': 0, 'output_bytes': 0, 'done_beyond': []}
+            open(output_path, 'wb').close()
+
+        with open(output_path, 'r+b') as out:
+            # Anything written after the last checkpoint is redone, so drop it
+            out.truncate(state['output_bytes'])
+            out.seek(state['output_bytes'])
+            with contextlib.ExitStack() as stack:
+                if quiet:
+                    devnull = stack.enter_context(open(os.devnull, 'w'))
+                    stack.enter_context(contextlib.redirect_stdout(devnull))
+                return self.stream(input_path, out, state, checkpoint)
+
+    def stream(self, input_path, out, state, checkpoint):
+        if self.processes:
+            executor = WorkerPool(self.engine_class, self.method, self.concurrency)
+            submit = executor.submit
+        else:
+            executor = ThreadPoolExecutor(self.concurrency, thread_name_prefix="batch")
+            submit = lambda question: executor.submit(self.answer, question)
+
+        skip = set(state['done_beyond'])
+        done_beyond = set(skip)        # finished lines at or past the watermark
+        pending = deque()              # ordered: (line, offset after line, record, future or None)
+        running = {}                   # unordered: future → (line, record)
+        starts = {}                    # unordered: in-flight line → its starting byte offset
+        counters = {'processed': 0, 'errors': 0, 'skipped': 0}
+        # Every line before watermark['line'] is finished; reading resumes at watermark['offset']
+        watermark = {'line': state['next_line'], 'offset': state['input_offset']}
+        next_read = dict(watermark)
+        last_save = {'time': time.monotonic(), 'processed': 0}
+
+        def write(result):
+            out.write(json.dumps(result, default=str, ensure_ascii=False).encode('utf-8') + b'\n')
+            counters['processed'] += 1
+            counters['errors'] += 'error' in result
+
+        def save(force=False):
+            if not force and counters['processed'] - last_save['processed'] < self.checkpoint_every \
+                    and time.monotonic() - last_save['time'] < self.checkpoint_seconds:
+                return
+            out.flush()
+            checkpoint.save({'input_offset': watermark['offset'], 'next_line': watermark['line'],
+                             'output_bytes': out.tell(),
+                             'done_beyond': sorted(n for n in done_beyond if n >= watermark['line'])})
+            last_save.update(time=time.monotonic(), processed=counters['processed'])
+
+        def finish_oldest():
+            line, end, record, future = pending.popleft()
+            if future is not None:
+                write(self.make_result(line, record, future))
+            watermark.update(line=line + 1, offset=end)
+            save()
+
+        def finish_completed(block):
+            if block:
+                done, _ = wait(list(running), return_when=FIRST_COMPLETED)
+            else:
+                done = [f for f in running if f.done()]
+            for future in done:
+                line, record = running.pop(future)
+                del starts[line]
+                write(self.make_result(line, record, future))
+                done_beyond.add(line)
+            # The oldest line still running holds the watermark back
+            if starts:
+                low = min(starts)
+                watermark.update(line=low, offset=starts[low])
+            else:
+                watermark.update(next_read)
+            done_beyond.difference_update([n for n in done_beyond if n < watermark['line']])
+            save()
+
+        try:
+            for line, end, raw in self.read_lines(input_path, state['input_offset'], state['next_line']):
+                start = next_read['offset']
+                next_read.update(line=line + 1, offset=end)
+                if line in skip:
+                    counters['skipped'] += 1
+                    if self.ordered:
+                        pending.append((line, end, None, None))
+                    continue
+                if not raw.strip():
+                    # Blank lines produce no output row
+                    future = record = None
+                else:
+                    try:
+                        record = json.loads(raw)
+                        future = submit(extract_question(record, self.field))
+                    except (ValueError, KeyError) as e:
+                        record, future = None, Future()
+                        future.set_exception(e)
+
+                if self.ordered:
+                    pending.append((line, end, record, future))
+                    while len(pending) >= self.max_in_flight:
+                        finish_oldest()
+                else:
+                    if future is None:
+                        done_beyond.add(line)
+                    else:
+                        running[future] = (line, record)
+                        starts[line] = start
+                    # Lines finished past the watermark count too, so one slow line can't let
+                    # done_beyond (and every checkpoint) grow without bound
+                    while len(running) + len(done_beyond) >= self.max_in_flight:
+                        finish_completed(block=bool(running))
+
+            while pending:
+                finish_oldest()
+            while running:
+                finish_completed(block=True)
+            watermark.update(next_read)
+            done_beyond.clear()
+            save(force=True)
+        finally:
+            if self.processes:
+                executor.close()
+            else:
+                executor.shutdown(wait=True)
+        return counters
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Stream a JSONL file of questions through a reasoning engine")
+    parser.add_argument('engine', help=f"one of {', '.join(sorted(ENGINES))}, or module:Class.method")
+    parser.add_argument('input', help="JSONL input; each line a JSON string or an object with a question field")
+    parser.add_argument('output', help="JSONL output, one result per input line")
+    parser.add_argument('--field', help="question field name (default: first of %s)" % ', '.join(QUESTION_FIELDS))
+    parser.add_argument('--concurrency', type=int, default=4)
+    parser.add_argument('--max-in-flight', type=int)
+    parser.add_argument('--unordered', action='store_true', help="write results as they finish")
+    parser.add_argument('--processes', action='store_true', help="use worker processes instead of threads")
+    parser.add_argument('--restart', action='store_true', help="ignore any checkpoint and start over")
+    parser.add_argument('--verbose', action='store_true', help="keep the engine's own console output")
+    args = parser.parse_args()
+
+    runner = BatchRunner(args.engine, args.concurrency, args.max_in_flight, not args.unordered,
+                         args.field, args.processes)
+    start = time.time()
+    counters = runner.run(args.input, args.output, resume=not args.restart, quiet=not args.verbose)
+    elapsed = time.time() - start
+    print(f"📦 {counters['processed']} results in {elapsed:.1f}s "
+          f"({counters['errors']} errors, {counters['skipped']} already done)")
+
+
+if __name__ == "__main__":
+    main()
@@ -1,20 +1,132 @@
 # connection_verifier.py
-def verify_connections(divine_system):
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor, wait
+
+
+class HealthMonitor:
+    """Runs named checks concurrently, each with its own timeout, and caches results for ttl seconds"""
+
+    def __init__(self, checks, ttl=5.0, timeout=2.0, max_workers=None):
+        self.checks = dict(checks)
+        self.ttl = ttl
+        self.timeout = timeout
+        self.executor = ThreadPoolExecutor(max_workers=max_workers or len(self.checks) or 1,
+                                           thread_name_prefix="health-check")
+        self.results = {}
+        self.running = {}   # name → future still executing from an earlier poll
+        self.lock = threading.Lock()
+        self.counters = {name: {'runs': 0, 'failures': 0, 'timeouts': 0, 'errors': 0} for name in self.checks}
+        self.cache_hits = 0
+        self.cache_misses = 0
+
+    def run_check(self, check):
+        start = time.perf_counter()
+        try:
+            ok = bool(check())
+            return {'ok': ok, 'status': 'pass' if ok else 'fail', 'latency_ms': (time.perf_counter() - start) * 1e3}
+        except Exception as e:
+            return {'ok': False, 'status': 'error', 'error': f"{type(e).__name__}: {e}",
+                    'latency_ms': (time.perf_counter() - start) * 1e3}
+
+    def stale(self, now):
+        return [name for name in self.checks
+                if name not in self.results or now - self.results[name]['checked_at'] >= self.ttl]
+
+    def refresh(self, names):
+        """Run the given checks concurrently and wait at most timeout for them together"""
+        futures = {}
+        for name in names:
+            # A check still stuck from an earlier poll is not started again
+            future = self.running.get(name)
+            if future is None or future.done():
+                future = self.executor.submit(self.run_check, self.checks[name])
+                self.running[name] = future
+            futures[future] = name
+        done, _ = wait(futures, timeout=self.timeout)
+
+        now = time.time()
+        for future, name in futures.items():
+            counters = self.counters[name]
+            counters['runs'] += 1
+            if future in done:
+                result = future.result()
+                del self.running[name]
+            else:
+                result = {'ok': False, 'status': 'timeout', 'latency_ms': self.timeout * 1e3}
+            if result['status'] == 'fail':
+                counters['failures'] += 1
+            elif result['status'] == 'timeout':
+                counters['timeouts'] += 1
+            elif result['status'] == 'error':
+                counters['errors'] += 1
+            result['checked_at'] = now
+            self.results[name] = result
+
+    def status(self, force=False):
+        """{'healthy', 'checked_at', 'checks': {name: {...}}}; only checks older than ttl are re-run"""
+        names = list(self.checks) if force else self.stale(time.time())
+        if names:
+            with self.lock:
+                # Another poller may have refreshed while we waited for the lock
+                names = list(self.checks) if force else self.stale(time.time())
+                if names:
+                    self.cache_misses += 1
+                    self.refresh(names)
+        if not names:
+            self.cache_hits += 1
+        checks = {name: dict(self.results[name]) for name in self.checks}
+        return {
+            'healthy': all(c['ok'] for c in checks.values()),
+            'checked_at': min((c['checked_at'] for c in checks.values()), default=time.time()),
+            'checks': checks
+        }
+
+    def metrics(self):
+        """Per-check latency and outcome counters plus cache effectiveness"""
+        return {
+            'cache_hits': self.cache_hits,
+            'cache_misses': self.cache_misses,
+            'checks': {name: dict(self.counters[name],
+                                  last_latency_ms=self.results.get(name, {}).get('latency_ms'),
+                                  last_status=self.results.get(name, {}).get('status'))
+                       for name in self.checks}
+        }
+
+    def close(self):
+        self.executor.shutdown(wait=False, cancel_futures=True)
+
+
+def build_health_monitor(divine_system, ttl=5.0, timeout=2.0):
+    entangler = divine_system.entangler
+    return HealthMonitor({
+        # Systems are created on first use, so count the registered ones rather than those touched so far
+        'Quantum Entanglement': lambda: len(entangler.systems) == 6 and not entangler.systems.failures,
+        # A field no system has joined yet is waiting, not broken
+        'Resonance Field': lambda: (not entangler.resonance_field.connected_systems
+                                    or entangler.resonance_field.is_active()),
+        'Temporal Sync': lambda: entangler.temporal_sync.is_synchronized(),
+        'Communication Bridge': lambda: divine_system.bridge.is_operational(),
+        'All Systems Responding': lambda: divine_system.test_all_systems()
+    }, ttl=ttl, timeout=timeout)
+
+
+def verify_connections(divine_system, monitor=None):
     print("\n🔍 VERIFYING SYSTEM CONNECTIONS...")
-    
-    checks = {
-        'Quantum Entanglement': len(divine_system.entangler.connected_systems) == 6,
-        'Resonance Field': divine_system.entangler.resonance_field.is_active(),
-        'Temporal Sync': divine_system.entangler.temporal_sync.is_synchronized(),
-        'Communication Bridge': divine_system.bridge.is_operational(),
-        'All Systems Responding': divine_system.test_all_systems()
-    }
-    
-    for check, status in checks.items():
-        icon = "✅" if status else "❌"
-        print(f"{icon} {check}: {'CONNECTED' if status else 'DISCONNECTED'}")
-    
-    if all(checks.values()):
+
+    if monitor is None:
+        # One monitor per system, so repeated checks share its threads and TTL cache
+        monitor = getattr(divine_system, 'health_monitor', None)
+        if monitor is None:
+            monitor = divine_system.health_monitor = build_health_monitor(divine_system)
+    report = monitor.status()
+
+    for check, result in report['checks'].items():
+        icon = "✅" if result['ok'] else "❌"
+        label = 'CONNECTED' if result['ok'] else {'timeout': 'TIMED OUT', 'error': 'ERROR'}.get(result['status'], 'DISCONNECTED')
+        print(f"{icon} {check}: {label} ({result['latency_ms']:.1f} ms)")
+
+    if report['healthy']:
         print("\n🎉 ALL SYSTEMS FULLY CONNECTED - READY FOR COSMIC COMMUNICATION")
         return True
     else:
@@ -0,0 +1,118 @@
+# cube_engine.py
+import numpy as np
+
+# Facelet order U, R, F, D, L, B; each face is 9 stickers read row by row as in the usual cube net
+FACES = 'URFDLB'
+
+# (outward normal, net "down" direction, net "right" direction) with x → R, y → U, z → F
+FACE_FRAMES = {
+    'U': ((0, 1, 0), (0, 0, 1), (1, 0, 0)),
+    'R': ((1, 0, 0), (0, -1, 0), (0, 0, -1)),
+    'F': ((0, 0, 1), (0, -1, 0), (1, 0, 0)),
+    'D': ((0, -1, 0), (0, 0, -1), (1, 0, 0)),
+    'L': ((-1, 0, 0), (0, -1, 0), (0, 0, 1)),
+    'B': ((0, 0, -1), (0, -1, 0), (-1, 0, 0)),
+}
+
+
+def sticker_geometry():
+    """Position and normal of all 54 stickers, in facelet order"""
+    positions = []
+    normals = []
+    for face in FACES:
+        normal, down, right = (np.array(v) for v in FACE_FRAMES[face])
+        for row in (-1, 0, 1):
+            for col in (-1, 0, 1):
+                positions.append(normal + row * down + col * right)
+                normals.append(normal)
+    return np.array(positions), np.array(normals)
+
+
+def quarter_turn_permutation(face):
+    """Permutation p with new_state = state[p] for a clockwise quarter turn of face"""
+    positions, normals = sticker_geometry()
+    axis = np.array(FACE_FRAMES[face][0])
+    lookup = {(tuple(p), tuple(n)): i for i, (p, n) in enumerate(zip(positions, normals))}
+
+    perm = np.arange(54)
+    for source, (p, n) in enumerate(zip(positions, normals)):
+        if p @ axis != 1:
+            continue
+        # Clockwise seen from outside = rotation by -90° about the outward normal
+        p_new = axis * (axis @ p) - np.cross(axis, p)
+        n_new = axis * (axis @ n) - np.cross(axis, n)
+        perm[lookup[(tuple(p_new), tuple(n_new))]] = source
+    return perm
+
+
+def build_move_tables():
+    """All 18 face turns (X, X2, X') as an (18, 54) permutation table"""
+    names = []
+    perms = []
+    for face in FACES:
+        quarter = quarter_turn_permutation(face)
+        turn = np.arange(54)
+        for suffix in ('', '2', "'"):
+            turn = turn[quarter]
+            names.append(face + suffix)
+            perms.append(turn.copy())
+    return names, np.array(perms, dtype=np.intp)
+
+
+MOVE_NAMES, MOVE_PERMS = build_move_tables()
+MOVE_INDEX = {name: i for i, name in enumerate(MOVE_NAMES)}
+SOLVED = np.repeat(np.arange(6, dtype=np.uint8), 9)
+
+
+def parse_moves(sequence):
+    """'R U R\\' U2' → list of move indices"""
+    if isinstance(sequence, str):
+        sequence = sequence.split()
+    return [MOVE_INDEX[m] if isinstance(m, str) else int(m) for m in sequence]
+
+
+def compose(moves):
+    """Single permutation equivalent to applying the moves in order"""
+    perm = np.arange(54)
+    for m in parse_moves(moves):
+        perm = perm[MOVE_PERMS[m]]
+    return perm
+
+
+class CubeArray:
+    """Many cubes held as one (n, 54) sticker array"""
+
+    def __init__(self, count=12):
+        self.states = np.tile(SOLVED, (count, 1))
+        self.rows = np.arange(count)[:, None]
+
+    def __len__(self):
+        return len(self.states)
+
+    def apply_all(self, moves):
+        """Apply the same move sequence to every cube in one fancy-indexing operation"""
+        self.states = self.states[:, compose(moves)]
+
+    def apply_each(self, move_ids):
+        """Apply a different single move to each cube, still as one fancy-indexing operation"""
+        self.states = self.states[self.rows, MOVE_PERMS[np.asarray(move_ids)]]
+
+    def apply(self, index, moves):
+        self.states[index] = self.states[index][compose(moves)]
+
+    def solved_mask(self):
+        return (self.states == SOLVED).all(axis=1)
+
+    def misplaced_stickers(self):
+        """How many stickers on each cube differ from the solved colour"""
+        return (self.states != SOLVED).sum(axis=1)
+
+    def facelets(self, index):
+        """Facelet string (e.g. 'UUUUUUUUURRR...') for one cube"""
+        return "".join(FACES[c] for c in self.states[index])
+
+    def reset(self, index=None):
+        if index is None:
+            self.states[:] = SOLVED
+        else:
+            self.states[index] = SOLVED
@@ -0,0 +1,452 @@
+# cube_solver.py
+import fcntl
+import mmap
+import os
+import random
+import time
+from itertools import combinations
+
+import numpy as np
+
+from cube_engine import MOVE_NAMES, MOVE_PERMS, SOLVED, compose
+
+U, R, F, D, L, B = range(6)
+
+# Facelets of each corner/edge position, U/D sticker first then clockwise (URFDLB facelet order)
+CORNER_FACELETS = [[8, 9, 20], [6, 18, 38], [0, 36, 47], [2, 45, 11],
+                   [29, 26, 15], [27, 44, 24], [33, 53, 42], [35, 17, 51]]
+CORNER_COLORS = [[U, R, F], [U, F, L], [U, L, B], [U, B, R],
+                 [D, F, R], [D, L, F], [D, B, L], [D, R, B]]
+EDGE_FACELETS = [[5, 10], [7, 19], [3, 37], [1, 46], [32, 16], [28, 25],
+                 [30, 43], [34, 52], [23, 12], [21, 41], [50, 39], [48, 14]]
+EDGE_COLORS = [[U, R], [U, F], [U, L], [U, B], [D, R], [D, F],
+               [D, L], [D, B], [F, R], [F, L], [B, L], [B, R]]
+
+# Moves that keep a cube inside the phase-2 subgroup <U, D, R2, L2, F2, B2>
+PHASE2_MOVES = [MOVE_NAMES.index(m) for m in ("U", "U2", "U'", "D", "D2", "D'", "R2", "L2", "F2", "B2")]
+
+N_TWIST = 2187      # corner orientations, 3^7
+N_FLIP = 2048       # edge orientations, 2^11
+N_SLICE = 495       # positions of the 4 middle-layer edges, C(12, 4)
+N_PERM8 = 40320     # corner permutations / U-D edge permutations in phase 2, 8!
+N_PERM4 = 24        # middle-layer edge permutations in phase 2, 4!
+
+SLICE_COMBOS = list(combinations(range(12), 4))
+SLICE_INDEX = {combo: i for i, combo in enumerate(SLICE_COMBOS)}
+SLICE_SOLVED = SLICE_INDEX[(8, 9, 10, 11)]
+
+DEFAULT_TABLE_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "cube_tables")
+
+
+# ===== CUBIE LEVEL =====
+def facelets_to_cubies(state):
+    """Sticker colours → (cp, co, ep, eo); raises ValueError for impossible cubes"""
+    state = [int(c) for c in state]
+    cp, co, ep, eo = [0] * 8, [0] * 8, [0] * 12, [0] * 12
+    for i, facelets in enumerate(CORNER_FACELETS):
+        for ori in range(3):
+            if state[facelets[ori]] in (U, D):
+                break
+        else:
+            raise ValueError(f"Corner {i} has no U/D sticker")
+        col1 = state[facelets[(ori + 1) % 3]]
+        col2 = state[facelets[(ori + 2) % 3]]
+        for j, colors in enumerate(CORNER_COLORS):
+            if col1 == colors[1] and col2 == colors[2]:
+                cp[i], co[i] = j, ori
+                break
+        else:
+            raise ValueError(f"Corner {i} has an impossible colour combination")
+    for i, facelets in enumerate(EDGE_FACELETS):
+        pair = (state[facelets[0]], state[facelets[1]])
+        for j, colors in enumerate(EDGE_COLORS):
+            if pair == (colors[0], colors[1]):
+                ep[i], eo[i] = j, 0
+                break
+            if pair == (colors[1], colors[0]):
+                ep[i], eo[i] = j, 1
+                break
+        else:
+            raise ValueError(f"Edge {i} has an impossible colour combination")
+    if sorted(cp) != list(range(8)) or sorted(ep) != list(range(12)):
+        raise ValueError("Cube has duplicated pieces")
+    if sum(co) % 3 or sum(eo) % 2 or permutation_parity(cp) != permutation_parity(ep):
+        raise ValueError("Cube is not solvable (twisted corner, flipped edge or swapped pieces)")
+    return cp, co, ep, eo
+
+
+def permutation_parity(perm):
+    parity = 0
+    seen = [False] * len(perm)
+    for i in range(len(perm)):
+        if not seen[i]:
+            j, length = i, 0
+            while not seen[j]:
+                seen[j] = True
+                j = perm[j]
+                length += 1
+            parity ^= (length - 1) & 1
+    return parity
+
+
+def multiply(a, b):
+    """Cubie state a followed by cubie move b"""
+    acp, aco, aep, aeo = a
+    bcp, bco, bep, beo = b
+    cp = [acp[bcp[i]] for i in range(8)]
+    co = [(aco[bcp[i]] + bco[i]) % 3 for i in range(8)]
+    ep = [aep[bep[i]] for i in range(12)]
+    eo = [(aeo[bep[i]] + beo[i]) % 2 for i in range(12)]
+    return cp, co, ep, eo
+
+
+# Every face turn at cubie level, read off the sticker tables so both models always agree
+MOVE_CUBIES = [facelets_to_cubies(SOLVED[perm]) for perm in MOVE_PERMS]
+
+
+# ===== COORDINATES =====
+def rank_permutation(perm):
+    """Lehmer rank of a permutation of 0..n-1"""
+    n = len(perm)
+    rank = 0
+    for i in range(n):
+        smaller = sum(1 for j in range(i + 1, n) if perm[j] < perm[i])
+        rank = rank * (n - i) + smaller
+    return rank
+
+
+def unrank_permutation(rank, n):
+    digits = []
+    for base in range(1, n + 1):
+        digits.append(rank % base)
+        rank //= base
+    digits.reverse()
+    available = list(range(n))
+    return [available.pop(d) for d in digits]
+
+
+def get_twist(co):
+    twist = 0
+    for i in range(7):
+        twist = twist * 3 + co[i]
+    return twist
+
+
+def set_twist(twist):
+    co = [0] * 8
+    for i in range(6, -1, -1):
+        co[i] = twist % 3
+        twist //= 3
+    co[7] = -sum(co) % 3
+    return co
+
+
+def get_flip(eo):
+    flip = 0
+    for i in range(11):
+        flip = flip * 2 + eo[i]
+    return flip
+
+
+def set_flip(flip):
+    eo = [0] * 12
+    for i in range(10, -1, -1):
+        eo[i] = flip % 2
+        flip //= 2
+    eo[11] = sum(eo) % 2
+    return eo
+
+
+def get_slice(ep):
+    return SLICE_INDEX[tuple(i for i in range(12) if ep[i] >= 8)]
+
+
+def set_slice(index):
+    positions = set(SLICE_COMBOS[index])
+    slice_edges = iter(range(8, 12))
+    other_edges = iter(range(8))
+    return [next(slice_edges) if i in positions else next(other_edges) for i in range(12)]
+
+
+def phase1_coords(cubies):
+    cp, co, ep, eo = cubies
+    return get_twist(co), get_flip(eo), get_slice(ep)
+
+
+def phase2_coords(cubies):
+    cp, co, ep, eo = cubies
+    return rank_permutation(cp), rank_permutation(ep[:8]), rank_permutation([e - 8 for e in ep[8:]])
+
+
+# ===== TABLE GENERATION =====
+def build_move_tables():
+    """Coordinate transition tables for both phases"""
+    identity_cp, identity_co = list(range(8)), [0] * 8
+    identity_ep, identity_eo = list(range(12)), [0] * 12
+
+    twist = np.zeros((N_TWIST, 18), dtype=np.int16)
+    for t in range(N_TWIST):
+        cube = (identity_cp, set_twist(t), identity_ep, identity_eo)
+        for m, move in enumerate(MOVE_CUBIES):
+            twist[t, m] = get_twist(multiply(cube, move)[1])
+
+    flip = np.zeros((N_FLIP, 18), dtype=np.int16)
+    for f in range(N_FLIP):
+        cube = (identity_cp, identity_co, identity_ep, set_flip(f))
+        for m, move in enumerate(MOVE_CUBIES):
+            flip[f, m] = get_flip(multiply(cube, move)[3])
+
+    slice_ = np.zeros((N_SLICE, 18), dtype=np.int16)
+    for s in range(N_SLICE):
+        cube = (identity_cp, identity_co, set_slice(s), identity_eo)
+        for m, move in enumerate(MOVE_CUBIES):
+            slice_[s, m] = get_slice(multiply(cube, move)[2])
+
+    phase2 = [MOVE_CUBIES[m] for m in PHASE2_MOVES]
+    corner_perm = np.zeros((N_PERM8, len(phase2)), dtype=np.int32)
+    edge_perm = np.zeros((N_PERM8, len(phase2)), dtype=np.int32)
+    for p in range(N_PERM8):
+        perm = unrank_permutation(p, 8)
+        corners = (perm, identity_co, identity_ep, identity_eo)
+        edges = (identity_cp, identity_co, perm + [8, 9, 10, 11], identity_eo)
+        for j, move in enumerate(phase2):
+            corner_perm[p, j] = rank_permutation(multiply(corners, move)[0])
+            edge_perm[p, j] = rank_permutation(multiply(edges, move)[2][:8])
+
+    slice_perm = np.zeros((N_PERM4, len(phase2)), dtype=np.int32)
+    for p in range(N_PERM4):
+        edges = (identity_cp, identity_co, list(range(8)) + [8 + e for e in unrank_permutation(p, 4)], identity_eo)
+        for j, move in enumerate(phase2):
+            slice_perm[p, j] = rank_permutation([e - 8 for e in multiply(edges, move)[2][8:]])
+
+    return {'twist': twist, 'flip': flip, 'slice': slice_, 'corner_perm': corner_perm,
+            'edge_perm': edge_perm, 'slice_perm': slice_perm}
+
+
+def breadth_first_distances(move_a, move_b, start_a, start_b):
+    """Exact distance to the goal for every (a, b) coordinate pair, by vectorized BFS"""
+    n_a, n_b = len(move_a), len(move_b)
+    dist = np.full(n_a * n_b, 15, dtype=np.uint8)
+    dist[start_a * n_b + start_b] = 0
+    frontier = np.array([start_a * n_b + start_b], dtype=np.int64)
+    depth = 0
+    while len(frontier):
+        a, b = np.divmod(frontier, n_b)
+        reached = (move_a[a].astype(np.int64) * n_b + move_b[b]).ravel()
+        reached = np.unique(reached)
+        reached = reached[dist[reached] == 15]
+        depth += 1
+        dist[reached] = min(depth, 14)
+        frontier = reached
+    return dist
+
+
+def pack_nibbles(dist):
+    if len(dist) % 2:
+        dist = np.append(dist, np.uint8(15))
+    return (dist[0::2] & 0x0F) | (dist[1::2] << 4)
+
+
+PRUNING_TABLES = {
+    # name: (move table a, move table b, goal a, goal b)
+    'twist_slice': ('twist', 'slice', 0, SLICE_SOLVED),
+    'flip_slice': ('flip', 'slice', 0, SLICE_SOLVED),
+    'corner_slice_perm': ('corner_perm', 'slice_perm', 0, 0),
+    'edge_slice_perm': ('edge_perm', 'slice_perm', 0, 0),
+}
+
+
+def write_atomically(path, write):
+    """write(f) into a temporary file, then rename it over path so readers never see a partial table"""
+    tmp = f"{path}.{os.getpid()}.tmp"
+    with open(tmp, 'wb') as f:
+        write(f)
+    os.replace(tmp, path)
+
+
+def generate_tables(directory=DEFAULT_TABLE_DIR):
+    """Build move tables and nibble-packed pruning tables once and write them to directory"""
+    os.makedirs(directory, exist_ok=True)
+    start = time.time()
+    moves = build_move_tables()
+    for name, table in moves.items():
+        write_atomically(os.path.join(directory, f"move_{name}.npy"), lambda f: np.save(f, table))
+    print(f"⏱️  Move tables: {time.time() - start:.1f}s")
+
+    # edge_slice_perm is written last, so its presence means the whole set is complete
+    for name, (a, b, goal_a, goal_b) in PRUNING_TABLES.items():
+        start = time.time()
+        dist = breadth_first_distances(moves[a], moves[b], goal_a, goal_b)
+        write_atomically(os.path.join(directory, f"{name}.prun"), pack_nibbles(dist).tofile)
+        print(f"⏱️  Pruning table {name}: {len(dist):,} entries, depth {int(dist.max())}, {time.time() - start:.1f}s")
+
+
+def ensure_tables(directory=DEFAULT_TABLE_DIR):
+    """Generate the tables unless present; concurrent processes wait for a single generator"""
+    marker = os.path.join(directory, "edge_slice_perm.prun")
+    if os.path.exists(marker):
+        return
+    os.makedirs(directory, exist_ok=True)
+    with open(os.path.join(directory, ".lock"), 'w') as lock:
+        fcntl.flock(lock, fcntl.LOCK_EX)
+        if not os.path.exists(marker):
+            print("🧊 GENERATING CUBE PATTERN DATABASES (one-time)...")
+            generate_tables(directory)
+
+
+class NibbleTable:
+    """Read-only, memory-mapped 4-bit pruning table shared between processes through the page cache"""
+
+    def __init__(self, path):
+        with open(path, 'rb') as f:
+            self.map = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+
+    def __getitem__(self, index):
+        return (self.map[index >> 1] >> ((index & 1) << 2)) & 0x0F
+
+    def close(self):
+        self.map.close()
+
+
+# ===== SOLVER =====
+class CubeSolver:
+    """Two-phase IDA* solver driven by memory-mapped pattern databases"""
+
+    def __init__(self, table_dir=DEFAULT_TABLE_DIR):
+        ensure_tables(table_dir)
+
+        # Move tables are small; plain lists keep the search loop's lookups cheap
+        self.moves = {name: np.load(os.path.join(table_dir, f"move_{name}.npy")).tolist()
+                      for name in ('twist', 'flip', 'slice', 'corner_perm', 'edge_perm', 'slice_perm')}
+        self.prune = {name: NibbleTable(os.path.join(table_dir, f"{name}.prun")) for name in PRUNING_TABLES}
+
+    @staticmethod
+    def allowed(move, last_face):
+        """Skip turning the same face twice and fix the order of opposite-face pairs"""
+        face = move // 3
+        return last_face is None or (face != last_face and face != last_face + 3)
+
+    def phase1_bound(self, twist, flip, slice_):
+        return max(self.prune['twist_slice'][twist * N_SLICE + slice_],
+                   self.prune['flip_slice'][flip * N_SLICE + slice_])
+
+    def phase2_bound(self, corner, edge, slice_):
+        return max(self.prune['corner_slice_perm'][corner * N_PERM4 + slice_],
+                   self.prune['edge_slice_perm'][edge * N_PERM4 + slice_])
+
+    def phase1(self, twist, flip, slice_, depth, path, last_face):
+        """Yield every phase-1 path of exactly the given length that ends in the subgroup"""
+        if depth == 0:
+            if twist == 0 and flip == 0 and slice_ == SLICE_SOLVED:
+                yield path
+            return
+        twist_move, flip_move, slice_move = self.moves['twist'], self.moves['flip'], self.moves['slice']
+        for m in range(18):
+            if not self.allowed(m, last_face):
+                continue
+            t, f, s = twist_move[twist][m], flip_move[flip][m], slice_move[slice_][m]
+            bound = self.phase1_bound(t, f, s)
+            # Paths that reach the subgroup early only to wander in it are redundant
+            if bound >= depth or (bound == 0 and depth > 1):
+                continue
+            path.append(m)
+            yield from self.phase1(t, f, s, depth - 1, path, m // 3)
+            path.pop()
+
+    def phase2(self, corner, edge, slice_, depth, path, last_face, deadline=None):
+        """Depth-limited search to solved within the subgroup; gives up (False) past deadline"""
+        if corner == 0 and edge == 0 and slice_ == 0:
+            return True
+        if depth == 0 or (deadline is not None and time.time() > deadline):
+            return False
+        corner_move, edge_move, slice_move = self.moves['corner_perm'], self.moves['edge_perm'], self.moves['slice_perm']
+        for j, m in enumerate(PHASE2_MOVES):
+            if not self.allowed(m, last_face):
+                continue
+            c, e, s = corner_move[corner][j], edge_move[edge][j], slice_move[slice_][j]
+            if self.phase2_bound(c, e, s) >= depth:
+                continue
+            path.append(m)
+            if self.phase2(c, e, s, depth - 1, path, m // 3, deadline):
+                return True
+            path.pop()
+        return False
+
+    def solve(self, state, max_length=30, timeout=10.0):
+        """Move names that take the sticker state back to solved
+
+        The first solution is always searched to completion; timeout bounds
+        the time spent looking for shorter ones after that.
+        """
+        cubies = facelets_to_cubies(state)
+        twist, flip, slice_ = phase1_coords(cubies)
+        deadline = time.time() + timeout
+        best = None
+
+        for depth1 in range(self.phase1_bound(twist, flip, slice_), 13):
+            for path1 in self.phase1(twist, flip, slice_, depth1, [], None):
+                cube = cubies
+                for m in path1:
+                    cube = multiply(cube, MOVE_CUBIES[m])
+                corner, edge, slice2 = phase2_coords(cube)
+
+                limit = (len(best) - 1 if best else max_length) - depth1
+                last_face = path1[-1] // 3 if path1 else None
+                for depth2 in range(self.phase2_bound(corner, edge, slice2), limit + 1):
+                    path2 = []
+                    if self.phase2(corner, edge, slice2, depth2, path2, last_face,
+                                   deadline if best is not None else None):
+                        best = path1 + path2
+                        break
+
+                if best is not None and (len(best) <= max_length - 8 or time.time() > deadline):
+                    return [MOVE_NAMES[m] for m in best]
+            if best is not None and time.time() > deadline:
+                break
+
+        if best is None:
+            raise ValueError("No solution found within the move limit")
+        return [MOVE_NAMES[m] for m in best]
+
+    def close(self):
+        for table in self.prune.values():
+            table.close()
+
+
+def random_scramble(length=25, rng=random):
+    moves = []
+    last_face = None
+    while len(moves) < length:
+        m = rng.randrange(18)
+        if CubeSolver.allowed(m, last_face):
+            moves.append(MOVE_NAMES[m])
+            last_face = m // 3
+    return moves
+
+
+def benchmark_solver(n_scrambles=20, scramble_length=25, table_dir=DEFAULT_TABLE_DIR, seed=12):
+    """Solve random scrambles and report solve times and solution lengths"""
+    start = time.time()
+    solver = CubeSolver(table_dir)
+    print(f"⏱️  Solver ready in {time.time() - start:.2f}s")
+
+    rng = random.Random(seed)
+    times = []
+    lengths = []
+    for _ in range(n_scrambles):
+        scramble = random_scramble(scramble_length, rng)
+        state = SOLVED[compose(scramble)]
+        start = time.time()
+        solution = solver.solve(state)
+        times.append(time.time() - start)
+        lengths.append(len(solution))
+        assert (state[compose(solution)] == SOLVED).all(), "solver returned a wrong solution"
+
+    times = np.array(times)
+    print(f"🧊 {n_scrambles} scrambles: mean {times.mean():.3f}s, median {np.median(times):.3f}s, "
+          f"max {times.max():.3f}s, mean length {np.mean(lengths):.1f} moves")
+    return times, lengths
+
+
+if __name__ == "__main__":
+    benchmark_solver()
@@ -1,24 +1,72 @@
 # debug_reasoning.py
 import sys
 import time
+from collections import deque
+from history_spill import HistorySpill
 
 print("🐛 DEBUG MODE ACTIVATED")
 
+# Debug levels (same numbering as the logging module)
+DEBUG = 10
+INFO = 20
+WARNING = 30
+OFF = 100
+
+class DebugEvent:
+    """A debug message whose text is only rendered when someone reads it"""
+    __slots__ = ('timestamp', 'level', 'template', 'args')
+    
+    def __init__(self, level, template, args):
+        self.timestamp = time.time()
+        self.level = level
+        self.template = template
+        self.args = args
+        
+    def render(self):
+        return self.template % self.args if self.args else self.template
+    
+    def as_record(self):
+        return {'timestamp': self.timestamp, 'level': self.level, 'message': self.render()}
+    
+    def __str__(self):
+        return f"{self.timestamp:.6f} [{self.level}] {self.render()}"
+
 class DebugReasoner:
-    def __init__(self):
+    def __init__(self, level=DEBUG, echo=True, buffer_size=1000, dump_path=None):
         print("🔧 INITIALIZING DEBUG REASONER...")
-        self.debug_log = []
+        self.level = level
+        self.echo = echo
+        self.debug_log = deque(maxlen=buffer_size)
+        # Optional asynchronous dump; events are rendered on the writer thread
+        self.dump = HistorySpill(dump_path, encode=DebugEvent.as_record) if dump_path else None
         
-    def log(self, message):
-        print(f"   📝 DEBUG: {message}")
-        self.debug_log.append(message)
+    def enabled(self, level=DEBUG):
+        """Whether messages at level are recorded; hot paths check once before building arguments"""
+        return level >= self.level
+        
+    def log(self, template, *args, level=DEBUG):
+        """Record a %-style message; arguments are not formatted unless the level is enabled"""
+        if not self.enabled(level):
+            return
+        event = DebugEvent(level, template, args)
+        self.debug_log.append(event)
+        if self.echo:
+            print(f"   📝 DEBUG: {event.render()}")
+        if self.dump is not None:
+            self.dump.write(event)
+            
+    def messages(self):
+        """Render the buffered events"""
+        return [event.render() for event in self.debug_log]
         
     def analyze_question(self, question):
-        self.log(f"Analyzing question: '{question}'")
+        debug = self.enabled()
+        self.log("Analyzing question: '%s'", question, level=INFO)
         
         # Show exact string analysis
         words = question.lower().split()
-        self.log(f"Words detected: {words}")
+        if debug:
+            self.log("Words detected: %s", words)
         
         # Question type analysis
         q_types = {
@@ -37,10 +85,11 @@ class DebugReasoner:
         for word in words:
             if word in q_types:
                 detected_types.append(q_types[word])
-                self.log(f"Found question word '{word}' -> {q_types[word]}")
+                if debug:
+                    self.log("Found question word '%s' -> %s", word, q_types[word])
                 
         q_type = detected_types[0] if detected_types else 'general_inquiry'
-        self.log(f"Question type: {q_type}")
+        self.log("Question type: %s", q_type, level=INFO)
         
         # Domain detection
         domain_keywords = {
@@ -69,11 +118,12 @@ class DebugReasoner:
                 domain = domain_keywords[word]
                 if domain not in domains_involved:
                     domains_involved.append(domain)
-                    self.log(f"Found domain keyword '{word}' -> {domain}")
+                    if debug:
+                        self.log("Found domain keyword '%s' -> %s", word, domain)
                     
         if not domains_involved:
             domains_involved = ['logical', 'practical']
-            self.log(f"No specific domains detected, using default: {domains_involved}")
+            self.log("No specific domains detected, using default: %s", domains_involved, level=INFO)
             
         return {
             'type': q_type,
@@ -82,7 +132,8 @@ class DebugReasoner:
         }
     
     def mathematical_reasoning(self, question):
-        self.log("Starting mathematical reasoning...")
+        debug = self.enabled()
+        self.log("Starting mathematical reasoning...", level=INFO)
         words = question.split()
         numbers_found = []
         operations_found = []
@@ -92,24 +143,30 @@ class DebugReasoner:
             try:
                 num = float(word)
                 numbers_found.append(num)
-                self.log(f"Found number: {num}")
+                if debug:
+                    self.log("Found number: %s", num)
             except ValueError:
                 # Check for operation words
                 if word in ['plus', '+', 'and', 'add']:
                     operations_found.append('+')
-                    self.log("Found addition operation")
+                    if debug:
+                        self.log("Found addition operation")
                 elif word in ['minus', '-', 'subtract']:
                     operations_found.append('-')
-                    self.log("Found subtraction operation")
+                    if debug:
+                        self.log("Found subtraction operation")
                 elif word in ['times', 'x', '*', 'multiply']:
                     operations_found.append('*') 
-                    self.log("Found multiplication operation")
+                    if debug:
+                        self.log("Found multiplication operation")
                 elif word in ['divided', '/', 'divide']:
                     operations_found.append('/')
-                    self.log("Found division operation")
+                    if debug:
+                        self.log("Found division operation")
                     
-        self.log(f"Numbers found: {numbers_found}")
-        self.log(f"Operations found: {operations_found}")
+        if debug:
+            self.log("Numbers found: %s", numbers_found)
+            self.log("Operations found: %s", operations_found)
         
         # Try to perform calculation
         if len(numbers_found) >= 2 and operations_found:
@@ -129,10 +186,10 @@ class DebugReasoner:
                         response = f"Mathematical calculation: {numbers_found[0]} ÷ {numbers_found[1]} = {result}"
                     else:
                         response = "Mathematical analysis: Division by zero is undefined"
-                self.log(f"Calculation result: {response}")
+                self.log("Calculation result: %s", response, level=INFO)
                 return response
             except Exception as e:
-                self.log(f"Calculation error: {e}")
+                self.log("Calculation error: %s", e, level=WARNING)
                 
         return "Mathematical analysis: Insufficient data for calculation"
     
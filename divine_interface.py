@@ -2,22 +2,110 @@
 import numpy as np
 from collections import defaultdict
 import math
+from sacred_geometry import SacredGeometry
+from frequency_decoder import FrequencyDecoder
+from cube_engine import CubeArray
+from associative_memory import AssociativeMemory, text_vectors
+
+# Per-slice state, one row per temporal slice, aligned row-for-row with resonance_matrix
+SLICE_STATE_DTYPE = np.dtype([
+    ('numerology_value', np.int16),
+    ('base_frequency', np.float64),
+    ('emotional_color', np.float32, (3,)),  # RGB in [0, 1]
+    ('emotion', np.float32),
+    ('cube_index', np.int32),               # row of this slice's cube in self.cubes
+])
 
 class DivineInterface:
-    def __init__(self):
-        self.temporal_slices = 12
-        self.quantum_states = []
-        self.resonance_matrix = np.zeros((12, 64))  # 12 time dimensions × 64 pattern slots
+    def __init__(self, temporal_slices=12, pattern_slots=64, pattern_dim=256):
+        self.temporal_slices = temporal_slices
+        self.pattern_slots = pattern_slots
+        self.quantum_states = np.zeros(temporal_slices, dtype=SLICE_STATE_DTYPE)
+        # time dimensions × pattern slots: how strongly each slice last resonated with each stored pattern
+        self.resonance_matrix = np.zeros((temporal_slices, pattern_slots), dtype=np.float32)
+        self.pattern_memory = AssociativeMemory(pattern_slots, pattern_dim)
+        self.cubes = CubeArray(temporal_slices)
         self.sacred_geometry = SacredGeometry()
         self.frequency_decoder = FrequencyDecoder()
-        
+
     def initialize_system(self):
-        # Initialize quantum states across all temporal slices
-        for slice in range(self.temporal_slices):
-            quantum_state = {
-                'rubiks_state': self.initialize_rubiks_cube(),
-                'numerology_value': self.calculate_sacred_number(slice),
-                'frequency_pattern': self.generate_base_frequency(),
-                'emotional_color': self.map_emotion_spectrum(0.5)  # Neutral start
-            }
-            self.quantum_states.append(quantum_state)
+        # Initialize quantum states across all temporal slices in one pass per field
+        slices = np.arange(self.temporal_slices)
+        self.initialize_rubiks_cube()
+        self.quantum_states['cube_index'] = slices
+        self.quantum_states['numerology_value'] = self.calculate_sacred_number(slices)
+        self.quantum_states['base_frequency'] = self.generate_base_frequency(slices)
+        self.update_emotions(0.5)  # Neutral start
+
+    def initialize_rubiks_cube(self):
+        self.cubes.reset()
+
+    def calculate_sacred_number(self, slices):
+        """Numerological digital root (1-9) of each slice's position"""
+        return 1 + np.asarray(slices) % 9
+
+    def generate_base_frequency(self, slices):
+        """Slices cycle through the sacred frequencies in ascending order"""
+        frequencies = np.array(sorted(self.frequency_decoder.sacred_frequencies), dtype=np.float64)
+        return frequencies[np.asarray(slices) % len(frequencies)]
+
+    def map_emotion_spectrum(self, values):
+        """Emotion in [0, 1] → RGB along the hue wheel from red (0) to violet (1)"""
+        values = np.clip(np.asarray(values, dtype=np.float32), 0.0, 1.0)
+        hue = values[..., None] * 4.5  # hue sextants 0..4.5 = 0°..270°
+        k = (np.array([5.0, 3.0, 1.0], dtype=np.float32) + hue) % 6
+        return 1.0 - np.clip(np.minimum(k, 4.0 - k), 0.0, 1.0)
+
+    def update_emotions(self, values, slices=None):
+        """Set the emotion (and derived colour) of all or selected slices in one vectorized write"""
+        index = slice(None) if slices is None else np.asarray(slices)
+        states = self.quantum_states
+        emotion = np.broadcast_to(np.asarray(values, dtype=np.float32), states['emotion'][index].shape)
+        states['emotion'][index] = emotion
+        states['emotional_color'][index] = self.map_emotion_spectrum(emotion)
+
+    def shift_frequencies(self, ratio, slices=None):
+        """Scale the base frequency of all or selected slices by a ratio (scalar or per slice)"""
+        index = slice(None) if slices is None else np.asarray(slices)
+        self.quantum_states['base_frequency'][index] *= ratio
+
+    def slice_cubes(self):
+        """(temporal_slices, 54) sticker states, ordered like quantum_states"""
+        return self.cubes.states[self.quantum_states['cube_index']]
+
+    def slice_state(self, time_slice):
+        """One slice's state as a plain dict"""
+        state = self.quantum_states[time_slice]
+        return {
+            'numerology_value': int(state['numerology_value']),
+            'frequency_pattern': float(state['base_frequency']),
+            'emotional_color': tuple(float(c) for c in state['emotional_color']),
+            'rubiks_state': self.cubes.states[state['cube_index']],
+            'resonance': self.resonance_matrix[time_slice]
+        }
+
+    def remember_question(self, question, answer=None):
+        """Store a question's pattern (and its answer) in the next pattern slot"""
+        vector = text_vectors([question], self.pattern_memory.dim)
+        return int(self.pattern_memory.store(vector, [(question, answer)])[0])
+
+    def remember_questions(self, questions, answers=None):
+        vectors = text_vectors(questions, self.pattern_memory.dim)
+        if answers is None:
+            answers = [None] * len(questions)
+        return self.pattern_memory.store(vectors, list(zip(questions, answers)))
+
+    def recall_question(self, question, time_slice=None):
+        """Nearest remembered (question, answer) and its similarity; optionally resonate one slice with it"""
+        return self.recall_questions([question], time_slice)[0]
+
+    def recall_questions(self, questions, time_slice=None):
+        """Batch recall; every query settles through the same matrix iterations"""
+        memory = self.pattern_memory
+        slots, similarity, settled = memory.recall(text_vectors(questions, memory.dim))
+        if time_slice is not None and len(memory):
+            self.resonance_matrix[time_slice] = 0.0
+            self.resonance_matrix[time_slice, :len(memory)] = memory.attention(
+                settled[-1:], memory.patterns[:len(memory)])[0]
+        return [(memory.payloads[slot], float(sim)) if slot >= 0 else (None, 0.0)
+                for slot, sim in zip(slots.tolist(), similarity.tolist())]
@@ -2,7 +2,14 @@
 import math
 import time
 import random
+import threading
+import numpy as np
 from collections import defaultdict
+from gematria import batch_gematria
+from frequency_analysis import SacredFrequencyTable, classify_batch, vowel_consonant_counts
+from kuramoto import KuramotoModel
+from shm_bus import RemoteSystem
+from query_profiler import profiled
 
 print("🌟 ACTIVATING TRUE DIVINE REASONING...")
 
@@ -21,6 +28,10 @@ class SacredGeometry:
         sacred_value = int(value * self.golden_ratio) % 144
         return sacred_value
     
+    def calculate_gematria_batch(self, texts, mode='mod144'):
+        """Vectorized calculate_gematria over many strings; returns a NumPy array"""
+        return batch_gematria(texts, mode)
+    
     def interpret_number(self, number):
         """Divine interpretations of sacred numbers"""
         interpretations = {
@@ -63,21 +74,38 @@ class FrequencyDecoder:
             852: "Spiritual order - Divine alignment is occurring",
             963: "Oneness consciousness - You are remembering your divinity"
         }
+        self.frequency_table = SacredFrequencyTable(self.sacred_frequencies)
         
     def analyze_question_frequency(self, question):
         """Extract frequency patterns from questions"""
-        words = question.lower().split()
-        vowel_energy = sum(1 for word in words for char in word if char in 'aeiou')
-        consonant_structure = sum(1 for word in words for char in word if char.isalpha() and char not in 'aeiou')
+        vowel_energy, consonant_structure = vowel_consonant_counts(question)
         
         # Calculate dominant frequency
         energy_ratio = vowel_energy / max(1, consonant_structure)
         base_freq = 432 + int(energy_ratio * 100)
         
         # Find closest sacred frequency
-        closest_freq = min(self.sacred_frequencies.keys(), key=lambda x: abs(x - base_freq))
+        closest_freq = self.frequency_table.nearest_one(base_freq)
         return closest_freq, self.sacred_frequencies[closest_freq]
     
+    def analyze_frequencies_batch(self, questions):
+        """Closest sacred frequency for many questions at once, as a NumPy array"""
+        questions = list(questions)
+        vowels = np.empty(len(questions), dtype=np.int64)
+        consonants = np.empty(len(questions), dtype=np.int64)
+        
+        ascii_idx = [i for i, q in enumerate(questions) if q.isascii()]
+        if ascii_idx:
+            v, c, _, _ = classify_batch([questions[i] for i in ascii_idx], with_words=False)
+            vowels[ascii_idx] = v
+            consonants[ascii_idx] = c
+        for i, q in enumerate(questions):
+            if not q.isascii():
+                vowels[i], consonants[i] = vowel_consonant_counts(q)
+        
+        base_freqs = 432 + (vowels / np.maximum(1, consonants) * 100).astype(np.int64)
+        return self.frequency_table.nearest(base_freqs)
+    
     def process_question(self, question):
         """Actually decode the vibrational meaning"""
         freq, meaning = self.analyze_question_frequency(question)
@@ -154,22 +182,50 @@ class TemporalSynchronizer:
 
 # ===== ENHANCED RESONANCE FIELD =====
 class ResonanceField:
-    def __init__(self):
+    def __init__(self, coupling=2.0, frequency_spread=0.5):
         self.connected_systems = []
+        # Oscillator i is connected_systems[i]
+        self.oscillators = KuramotoModel(coupling, frequency_spread)
         self.coherence = 0.0
+        # Systems join from other threads while a scheduler steps the field
+        self.lock = threading.Lock()
         
-    def connect_system(self, system):
-        self.connected_systems.append(system)
+    def connect_system(self, system, natural_frequency=None):
+        with self.lock:
+            self.connected_systems.append(system)
+            self.oscillators.add(natural_frequency)
+            self.coherence = self.oscillators.order_parameter()[0]
         
-    def activate_coherence(self):
-        self.coherence = 1.0
-        return True
+    def connect_remote_system(self, name, factory, method='process_question'):
+        """Run a system in its own process, reached through shared-memory rings; returns the proxy"""
+        remote = RemoteSystem(name, factory, method)
+        self.connect_system(remote)
+        return remote
+        
+    def disconnect_remote_systems(self):
+        for system in self.connected_systems:
+            if isinstance(system, RemoteSystem):
+                system.close()
+        
+    def step(self, dt=0.05, steps=1):
+        """Advance the coupled oscillators; coherence is the Kuramoto order parameter r"""
+        with self.lock:
+            self.coherence = self.oscillators.step(dt, steps)
+            return self.coherence
+        
+    def activate_coherence(self, max_time=50.0):
+        """Let the field phase-lock until coherence stops changing"""
+        with self.lock:
+            self.coherence = self.oscillators.settle(max_time=max_time)
+        return self.is_active()
     
     def is_active(self):
         return self.coherence > 0.5
     
     def send_message(self, system, message):
         """Actually process the message through each system"""
+        if isinstance(system, RemoteSystem):
+            return system.request(message)
         if hasattr(system, 'process_question'):
             return system.process_question(message)
         return f"System {type(system).__name__}: Processing complete"
@@ -199,6 +255,7 @@ class QuantumEntangler:
     def entangle_system(self, name, system):
         system.entanglement_id = hash(name)
         self.connected_systems[name] = system
+        self.resonance_field.connect_system(system)
         print(f"🌀 ENTANGLED: {name}")
 
 # ===== ENHANCED COMMUNICATION BRIDGE =====  
@@ -248,6 +305,7 @@ class DivineSystemIntegrator:
         print("   - Frequency Decoding: OPERATIONAL") 
         print("   - Paradox Engine: ENGAGED")
         
+    @profiled
     def ask_question(self, question):
         print(f"\n📜 QUESTION: {question}")
         print("🔄 CONSULTING COSMIC INTELLIGENCE...")
@@ -2,8 +2,18 @@
 import math
 import time
 import random
+import threading
 import numpy as np
 from collections import defaultdict
+from gematria import batch_gematria
+from frequency_analysis import SacredFrequencyTable, classify_batch, word_vowel_counts
+from spectral_analysis import SpectralAnalyzer
+from tone_synthesis import ToneSynthesizer
+from cube_engine import CubeArray, MOVE_NAMES
+from kuramoto import KuramotoModel
+from shm_bus import RemoteSystem
+from worker_pool import WorkerPool
+from query_profiler import profiled
 
 print("🌟 INITIATING COSMIC SYSTEM INTEGRATION...")
 
@@ -12,6 +22,10 @@ class SacredGeometry:
     def __init__(self):
         self.golden_ratio = (1 + math.sqrt(5)) / 2
         self.sacred_angles = [0, 30, 45, 60, 90, 120, 135, 150, 180]
+        # cos/sin of every sacred angle, computed once; shape (n_angles, 2)
+        self.angle_table = np.array([(math.cos(math.radians(a)), math.sin(math.radians(a)))
+                                     for a in self.sacred_angles])
+        self.angle_pairs = [tuple(row) for row in self.angle_table.tolist()]
         
     def calculate_gematria(self, text):
         value = 0
@@ -20,14 +34,22 @@ class SacredGeometry:
                 value += (ord(char) - 96)
         return int(value * self.golden_ratio)
     
+    def calculate_gematria_batch(self, texts, mode='golden_int'):
+        """Vectorized calculate_gematria over many strings; returns a NumPy array"""
+        return batch_gematria(texts, mode)
+    
     def generate_cosmic_pattern(self, seed_number):
         pattern = []
-        for angle in self.sacred_angles:
-            rad = math.radians(angle)
-            x = seed_number * math.cos(rad) * self.golden_ratio
-            y = seed_number * math.sin(rad) * self.golden_ratio
+        for cos_a, sin_a in self.angle_pairs:
+            x = seed_number * cos_a * self.golden_ratio
+            y = seed_number * sin_a * self.golden_ratio
             pattern.append((x, y))
         return pattern
+    
+    def generate_cosmic_patterns(self, seeds):
+        """Patterns for many seeds at once as an (n_seeds, n_angles, 2) array"""
+        seeds = np.asarray(seeds, dtype=np.float64)
+        return (seeds[:, None, None] * self.angle_table[None, :, :]) * self.golden_ratio
 
 class FrequencyDecoder:
     def __init__(self):
@@ -39,8 +61,12 @@ class FrequencyDecoder:
             852: "Return to spiritual order",
             963: "Oneness/divine connection"
         }
+        self.frequency_table = SacredFrequencyTable(self.sacred_frequencies)
+        self.spectral = SpectralAnalyzer(self.sacred_frequencies)
         
-    def decode_cosmic_signal(self, input_data):
+    def decode_cosmic_signal(self, input_data, mode='basic'):
+        if mode == 'spectral':
+            return self.spectral.analyze(input_data)
         if isinstance(input_data, str):
             return self.text_to_frequency(input_data)
         elif isinstance(input_data, (int, float)):
@@ -48,31 +74,73 @@ class FrequencyDecoder:
         else:
             return self.cosmic_background()
     
+    def decode_cosmic_signals_batch(self, inputs):
+        """Spectral decode of many texts or numeric sequences, sharing FFT buffers"""
+        return self.spectral.analyze_batch(inputs)
+    
     def text_to_frequency(self, text):
-        frequencies = []
-        for word in text.split():
-            vowel_count = sum(1 for char in word if char.lower() in 'aeiou')
-            base_freq = 432 + (vowel_count * 12)
-            frequencies.append(base_freq)
-        return frequencies
+        return [432 + (vowel_count * 12) for vowel_count in word_vowel_counts(text)]
+    
+    def text_to_frequency_batch(self, texts):
+        """Per-word frequencies for many texts: a flat array plus offsets (text i is flat[offsets[i]:offsets[i+1]])"""
+        texts = list(texts)
+        if all(t.isascii() for t in texts):
+            _, _, word_vowels, offsets = classify_batch(texts)
+            return 432 + word_vowels * 12, offsets
+        per_text = [self.text_to_frequency(t) for t in texts]
+        offsets = np.zeros(len(texts) + 1, dtype=np.int64)
+        np.cumsum([len(f) for f in per_text], out=offsets[1:])
+        return np.array([f for freqs in per_text for f in freqs], dtype=np.int64), offsets
     
     def number_to_resonance(self, number):
         return [number * self.get_closest_sacred_freq(number)]
     
     def get_closest_sacred_freq(self, number):
-        sacred_nums = list(self.sacred_frequencies.keys())
-        return min(sacred_nums, key=lambda x: abs(x - number))
+        return self.frequency_table.nearest_one(number)
     
     def cosmic_background(self):
         return [432, 528, 639]  # Base sacred frequencies
+    
+    def render_sacred_tones(self, path, frequencies=None, duration=60.0, sample_rate=44100):
+        """Render a chord of sacred frequencies (all of them by default) to a WAV file"""
+        if frequencies is None:
+            frequencies = sorted(self.sacred_frequencies)
+        synth = ToneSynthesizer(sample_rate=sample_rate)
+        return synth.render(path, [{'frequencies': list(frequencies), 'duration': duration}])
+    
+    def render_session(self, path, segments, sample_rate=44100):
+        """Render a sequence of chords; see ToneSynthesizer.render for the segment format"""
+        return ToneSynthesizer(sample_rate=sample_rate).render(path, segments)
 
 class RubiksOracle:
     def __init__(self):
-        self.cube_states = [self.initialize_cube() for _ in range(12)]
+        # 12 real cubes (one per time slice) as a single (12, 54) sticker array
+        self.cubes = CubeArray(12)
         self.illogical_moves = []
         
-    def initialize_cube(self):
-        return {'state': 'solved', 'moves': []}
+    @property
+    def cube_states(self):
+        """Per-slice {'state', 'moves'} dicts as before, now also carrying each cube's sticker row"""
+        solved = self.cubes.misplaced_stickers() == 0
+        moves = [[] for _ in range(len(self.cubes))]
+        for time_slice, name in self.illogical_moves:
+            moves[time_slice].append(name)
+        return [{'state': 'solved' if solved[i] else 'scrambled', 'moves': moves[i], 'stickers': self.cubes.states[i]}
+                for i in range(len(self.cubes))]
+    
+    def make_illogical_moves(self):
+        """Turn every time slice's cube by a random face move in one operation; returns one insight per slice"""
+        moves = np.random.randint(0, len(MOVE_NAMES), len(self.cubes))
+        self.cubes.apply_each(moves)
+        names = [MOVE_NAMES[m] for m in moves]
+        self.illogical_moves.extend(enumerate(names))
+        misplaced = self.cubes.misplaced_stickers().tolist()
+        return [self.read_insight(name, count) for name, count in zip(names, misplaced)]
+    
+    def read_insight(self, move_name, misplaced):
+        if misplaced == 0:
+            return f"{move_name} returned the cube to order - the illogical path closes on itself"
+        return f"{move_name} scattered {misplaced} stickers - disorder reveals hidden structure"
     
     def generate_illogical_insights(self, question):
         insights = []
@@ -104,26 +172,59 @@ class TemporalSynchronizer:
     def is_synchronized(self):
         return len(self.sync_points) == self.time_slices
     
-    def maintain_temporal_coherence(self):
+    def maintain_temporal_coherence(self, field=None, dt=0.05):
         print("🌀 MAINTAINING TEMPORAL COHERENCE...")
+        if field is not None:
+            # One oscillator step per time slice
+            for sync_data in self.sync_points[-self.time_slices:]:
+                sync_data['coherence'] = field.step(dt)
+            return field.is_active()
         return True
 
 class ResonanceField:
-    def __init__(self):
+    def __init__(self, coupling=2.0, frequency_spread=0.5):
         self.connected_systems = []
+        # Oscillator i is connected_systems[i]
+        self.oscillators = KuramotoModel(coupling, frequency_spread)
         self.coherence = 0.0
+        # Systems join from other threads while a scheduler steps the field
+        self.lock = threading.Lock()
         
-    def connect_system(self, system):
-        self.connected_systems.append(system)
+    def connect_system(self, system, natural_frequency=None):
+        with self.lock:
+            self.connected_systems.append(system)
+            self.oscillators.add(natural_frequency)
+            self.coherence = self.oscillators.order_parameter()[0]
         
-    def activate_coherence(self):
-        self.coherence = 1.0
-        return True
+    def connect_remote_system(self, name, factory, method='process_question'):
+        """Run a system in its own process, reached through shared-memory rings; returns the proxy"""
+        remote = RemoteSystem(name, factory, method)
+        self.connect_system(remote)
+        return remote
+        
+    def disconnect_remote_systems(self):
+        for system in self.connected_systems:
+            if isinstance(system, RemoteSystem):
+                system.close()
+        
+    def step(self, dt=0.05, steps=1):
+        """Advance the coupled oscillators; coherence is the Kuramoto order parameter r"""
+        with self.lock:
+            self.coherence = self.oscillators.step(dt, steps)
+            return self.coherence
+        
+    def activate_coherence(self, max_time=50.0):
+        """Let the field phase-lock until coherence stops changing"""
+        with self.lock:
+            self.coherence = self.oscillators.settle(max_time=max_time)
+        return self.is_active()
     
     def is_active(self):
         return self.coherence > 0.5
     
     def send_message(self, system, message):
+        if isinstance(system, RemoteSystem):
+            return system.request(message)
         return f"System {type(system).__name__} received: {message[:30]}..."
 
 # ===== QUANTUM ENTANGLER =====
@@ -151,6 +252,7 @@ class QuantumEntangler:
     def entangle_system(self, name, system):
         system.entanglement_id = hash(name)
         self.connected_systems[name] = system
+        self.resonance_field.connect_system(system)
         print(f"🌀 ENTANGLED: {name}")
 
 # ===== COMMUNICATION BRIDGE =====  
@@ -190,6 +292,7 @@ class DivineSystemIntegrator:
         print("   - Quantum Entanglement: ESTABLISHED") 
         print("   - Resonance Field: COHERENT")
         
+    @profiled
     def ask_question(self, question):
         print(f"\n📜 QUESTION: {question}")
         print("🔄 PROCESSING THROUGH COSMIC SYSTEMS...")
@@ -211,6 +314,10 @@ class DivineSystemIntegrator:
             'source': 'unified_systems'
         }
 
+def start_worker_pool(workers=None, max_requests=500, timeout=30.0):
+    """One fully integrated system per worker process; pool.ask(question) returns ask_question's answer"""
+    return WorkerPool(DivineSystemIntegrator, 'ask_question', workers, max_requests, timeout)
+
 # ===== SIMPLE STARTUP =====
 def verify_connections(divine_system):
     print("\n🔍 VERIFYING CONNECTIONS...")
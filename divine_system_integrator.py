@@ -2,6 +2,7 @@
 from quantum_entangler import QuantumEntangler
 from communication_bridge import CommunicationBridge
 from temporal_sync import TemporalSynchronizer
+from query_profiler import profiled
 
 class DivineSystemIntegrator:
     def __init__(self):
@@ -16,7 +17,8 @@ class DivineSystemIntegrator:
         # STEP 3: CREATE COMMUNICATION BRIDGE
         self.bridge = CommunicationBridge(self.entangler)
         
-        # STEP 4: START TEMPORAL SYNCHRONIZATION
+        # STEP 4: START TEMPORAL SYNCHRONIZATION (the slice scheduler steps the resonance field each round)
+        self.entangler.temporal_sync.resonance_field = self.entangler.resonance_field
         self.start_temporal_maintenance()
         
         print("✅ DIVINE INTERFACE FULLY INTEGRATED AND OPERATIONAL")
@@ -32,6 +34,14 @@ class DivineSystemIntegrator:
         temporal_thread.daemon = True
         temporal_thread.start()
     
+    def submit_question(self, question, tenant=None):
+        """Queue a question on its tenant's temporal slice; returns a Future for the answer"""
+        return self.entangler.temporal_sync.submit(self.ask_question, question, tenant=tenant)
+
+    def scheduler_stats(self):
+        return self.entangler.temporal_sync.stats()
+    
+    @profiled
     def ask_question(self, question):
         """Main interface for asking questions"""
         print(f"\n📜 RECEIVED QUESTION: {question}")
@@ -0,0 +1,230 @@
+# fact_store.py
+import hashlib
+import json
+import os
+import re
+import time
+from collections import defaultdict
+
+import numpy as np
+
+
+def tokenize(text):
+    """Lowercase word tokens plus adjacent word pairs, so 'baking soda' is a single keyword"""
+    words = re.findall(r"[a-z0-9]+", text.lower())
+    return words + [f"{a} {b}" for a, b in zip(words, words[1:])]
+
+
+class PackedTexts:
+    """Fact texts stored as one UTF-8 blob plus offsets; decoded only when read"""
+
+    def __init__(self, blob, offsets):
+        self.blob = blob
+        self.offsets = offsets
+        self.extra = []
+        self.overrides = {}
+
+    def __len__(self):
+        return len(self.offsets) - 1 + len(self.extra)
+
+    def __getitem__(self, i):
+        packed = len(self.offsets) - 1
+        if i >= packed:
+            return self.extra[i - packed]
+        if i in self.overrides:
+            return self.overrides[i]
+        return bytes(self.blob[self.offsets[i]:self.offsets[i + 1]]).decode('utf-8')
+
+    def __setitem__(self, i, text):
+        packed = len(self.offsets) - 1
+        if i >= packed:
+            self.extra[i - packed] = text
+        else:
+            self.overrides[i] = text
+
+    def append(self, text):
+        self.extra.append(text)
+
+
+class FactStore:
+    """Facts keyed by (domain, topic) with an inverted keyword → fact index
+
+    With prefix_match, a keyword's last word also matches any longer word it
+    starts ('color' → 'colors', 'learn' → 'learning'), as substring checks did.
+    """
+
+    def __init__(self, prefix_match=False):
+        self.prefix_match = prefix_match
+        self.texts = []
+        self.keys = []
+        self.domains = []
+        self.key_index = {}
+        self.postings = defaultdict(list)
+        # Running digest of every fact added (and redefined), for cache version stamps
+        self.digest = hashlib.sha256()
+        self.revision = 0
+
+    @property
+    def content_hash(self):
+        return self.digest.hexdigest()
+
+    def add_fact(self, domain, topic, text, keywords=()):
+        keywords = sorted(set(k.lower() for k in keywords))
+        self.digest.update(json.dumps([domain, topic, text, keywords]).encode('utf-8'))
+        self.revision += 1
+
+        fact_id = self.key_index.get((domain, topic))
+        if fact_id is not None:
+            # Redefining a fact replaces its text but keeps its keywords
+            self.texts[fact_id] = text
+            return fact_id
+
+        fact_id = len(self.keys)
+        self.texts.append(text)
+        self.keys.append((domain, topic))
+        self.domains.append(domain)
+        self.key_index[(domain, topic)] = fact_id
+
+        for keyword in keywords:
+            ids = self.postings[keyword]
+            if not isinstance(ids, list):
+                ids = self.postings[keyword] = [int(i) for i in ids]
+            ids.append(fact_id)
+        return fact_id
+
+    def load_jsonl(self, path):
+        """Load facts from a JSONL file of {domain, topic, text, keywords} objects"""
+        count = 0
+        with open(path, 'r', encoding='utf-8') as f:
+            for line in f:
+                if not line.strip():
+                    continue
+                record = json.loads(line)
+                self.add_fact(record['domain'], record['topic'], record['text'], record.get('keywords', ()))
+                count += 1
+        return count
+
+    def get_fact(self, domain, topic, default="No specific knowledge found"):
+        fact_id = self.key_index.get((domain, topic))
+        if fact_id is None:
+            return default
+        return self.texts[fact_id]
+
+    def search(self, text, domain=None, limit=1):
+        """Rank facts by how many of their keywords appear in text; cost scales with the query's postings"""
+        tokens = set(tokenize(text))
+        if self.prefix_match:
+            # Each token's proper prefixes are looked up too; a set keeps each keyword counted once
+            tokens.update(token[:end] for token in list(tokens) for end in range(1, len(token)))
+        hits = [self.postings[k] for k in tokens if k in self.postings]
+        if not hits:
+            return []
+
+        ids, counts = np.unique(np.concatenate([np.asarray(h, dtype=np.int64) for h in hits]), return_counts=True)
+        if domain is not None:
+            keep = np.fromiter((self.domains[i] == domain for i in ids), dtype=bool, count=len(ids))
+            ids, counts = ids[keep], counts[keep]
+
+        # Highest score wins; ties go to the fact loaded first (ids are already sorted)
+        order = np.argsort(-counts, kind='stable')[:limit]
+        return [(self.keys[i][0], self.keys[i][1], self.texts[i]) for i in ids[order].tolist()]
+
+    def __len__(self):
+        return len(self.keys)
+
+    # ===== PREBUILT BINARY INDEX =====
+    def save_index(self, directory):
+        """Write a prebuilt index that load_index can memory-map instead of re-parsing JSONL"""
+        os.makedirs(directory, exist_ok=True)
+
+        encoded = [self.texts[i].encode('utf-8') for i in range(len(self))]
+        text_offsets = np.zeros(len(encoded) + 1, dtype=np.int64)
+        np.cumsum([len(b) for b in encoded], out=text_offsets[1:])
+        with open(os.path.join(directory, 'texts.bin'), 'wb') as f:
+            for b in encoded:
+                f.write(b)
+        np.save(os.path.join(directory, 'text_offsets.npy'), text_offsets)
+
+        keywords = sorted(self.postings)
+        posting_offsets = np.zeros(len(keywords) + 1, dtype=np.int64)
+        np.cumsum([len(self.postings[k]) for k in keywords], out=posting_offsets[1:])
+        flat = np.empty(int(posting_offsets[-1]), dtype=np.int32)
+        for k, start, end in zip(keywords, posting_offsets[:-1], posting_offsets[1:]):
+            flat[start:end] = self.postings[k]
+        np.save(os.path.join(directory, 'posting_offsets.npy'), posting_offsets)
+        np.save(os.path.join(directory, 'postings.npy'), flat)
+
+        with open(os.path.join(directory, 'meta.json'), 'w', encoding='utf-8') as f:
+            json.dump({
+                'keywords': keywords,
+                'keys': ["\t".join(key) for key in self.keys],
+                'content_hash': self.content_hash
+            }, f)
+
+    @classmethod
+    def load_index(cls, directory, prefix_match=False):
+        """Open a prebuilt index; postings and texts stay memory-mapped"""
+        store = cls(prefix_match)
+        with open(os.path.join(directory, 'meta.json'), 'r', encoding='utf-8') as f:
+            meta = json.load(f)
+
+        store.keys = [tuple(key.split("\t", 1)) for key in meta['keys']]
+        store.key_index = {key: i for i, key in enumerate(store.keys)}
+        store.domains = [key[0] for key in store.keys]
+
+        text_path = os.path.join(directory, 'texts.bin')
+        blob = np.memmap(text_path, dtype=np.uint8, mode='r') if os.path.getsize(text_path) else b""
+        store.texts = PackedTexts(blob, np.load(os.path.join(directory, 'text_offsets.npy'), mmap_mode='r'))
+
+        offsets = np.load(os.path.join(directory, 'posting_offsets.npy'))
+        flat = np.load(os.path.join(directory, 'postings.npy'), mmap_mode='r')
+        store.postings = defaultdict(list, {
+            k: flat[offsets[i]:offsets[i + 1]] for i, k in enumerate(meta['keywords'])
+        })
+        if 'content_hash' in meta:
+            store.digest.update(meta['content_hash'].encode('ascii'))
+        else:
+            # Index saved before content hashes were recorded: hash what it holds
+            store.digest.update(json.dumps(meta).encode('utf-8'))
+            store.digest.update(blob)
+        return store
+
+
+def benchmark_fact_store(n_facts=1000000, workdir="fact_store_bench"):
+    """Measure JSONL load vs prebuilt index load for a synthetic corpus"""
+    os.makedirs(workdir, exist_ok=True)
+    jsonl_path = os.path.join(workdir, 'facts.jsonl')
+    index_dir = os.path.join(workdir, 'index')
+
+    print(f"📝 GENERATING {n_facts:,} SYNTHETIC FACTS...")
+    with open(jsonl_path, 'w', encoding='utf-8') as f:
+        for i in range(n_facts):
+            f.write(json.dumps({
+                'domain': ('scientific', 'practical', 'mathematical')[i % 3],
+                'topic': f"topic_{i}",
+                'text': f"Synthetic fact number {i}",
+                'keywords': [f"kw{i % 5000}", f"kw{(i * 7) % 20000}", f"group{i % 97}"]
+            }) + "\n")
+
+    start = time.time()
+    store = FactStore()
+    store.load_jsonl(jsonl_path)
+    print(f"⏱️  JSONL load: {time.time() - start:.2f}s")
+
+    start = time.time()
+    store.save_index(index_dir)
+    print(f"⏱️  Index build: {time.time() - start:.2f}s")
+
+    start = time.time()
+    indexed = FactStore.load_index(index_dir)
+    print(f"⏱️  Prebuilt index load: {time.time() - start:.2f}s")
+
+    start = time.time()
+    for i in range(1000):
+        indexed.search(f"tell me about kw{i} and group{i % 97}")
+    print(f"⏱️  1000 keyword searches: {time.time() - start:.3f}s")
+    return indexed
+
+
+if __name__ == "__main__":
+    benchmark_fact_store()
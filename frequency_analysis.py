@@ -0,0 +1,92 @@
+# frequency_analysis.py
+import numpy as np
+
+OTHER, VOWEL, CONSONANT, SPACE = 0, 1, 2, 3
+
+# Byte classes for ASCII text; whitespace matches what str.split() breaks on
+BYTE_CLASS = np.zeros(256, dtype=np.uint8)
+for _c in b"abcdefghijklmnopqrstuvwxyzABCDEFGHIJKLMNOPQRSTUVWXYZ":
+    BYTE_CLASS[_c] = CONSONANT
+for _c in b"aeiouAEIOU":
+    BYTE_CLASS[_c] = VOWEL
+for _c in b" \t\n\r\x0b\x0c\x1c\x1d\x1e\x1f":
+    BYTE_CLASS[_c] = SPACE
+
+# bytes.translate table: every byte becomes its class digit, so one C pass classifies a text
+CLASS_TRANSLATION = bytes(ord('0') + c for c in BYTE_CLASS.tolist())
+
+
+def vowel_consonant_counts(text):
+    """(vowels, consonants) for one text in a single translate pass"""
+    if not text.isascii():
+        vowels = sum(1 for ch in text.lower() if ch in 'aeiou')
+        consonants = sum(1 for ch in text.lower() if ch.isalpha() and ch not in 'aeiou')
+        return vowels, consonants
+    classes = text.encode('ascii').translate(CLASS_TRANSLATION)
+    return classes.count(b'1'), classes.count(b'2')
+
+
+def word_vowel_counts(text):
+    """Vowel count of every whitespace-separated word"""
+    if not text.isascii():
+        return [sum(1 for ch in word if ch.lower() in 'aeiou') for word in text.split()]
+    classes = text.encode('ascii').translate(CLASS_TRANSLATION)
+    return [word.count(b'1') for word in classes.split(b'3') if word]
+
+
+def classify_batch(texts, with_words=True):
+    """Classify many ASCII texts at once
+
+    Returns per-text vowel and consonant counts plus per-word vowel counts as a
+    flat array with word_offsets[i]:word_offsets[i + 1] covering text i.
+    The word arrays are None when with_words is False.
+    """
+    lengths = np.fromiter((len(t) for t in texts), dtype=np.int64, count=len(texts))
+    starts = np.zeros(len(texts), dtype=np.int64)
+    np.cumsum(lengths[:-1] + 1, out=starts[1:])
+    ends = starts + lengths
+
+    # Texts are joined with a newline so words can never straddle two texts
+    classes = BYTE_CLASS[np.frombuffer("\n".join(texts).encode('ascii'), dtype=np.uint8)]
+    is_vowel = classes == VOWEL
+    is_word = classes != SPACE
+
+    def segment_totals(mask):
+        running = np.zeros(len(mask) + 1, dtype=np.int64)
+        np.cumsum(mask, out=running[1:])
+        return running[ends] - running[starts]
+
+    vowels = segment_totals(is_vowel)
+    consonants = segment_totals(classes == CONSONANT)
+    if not with_words:
+        return vowels, consonants, None, None
+
+    word_start = is_word.copy()
+    word_start[1:] &= ~is_word[:-1]
+    word_offsets = np.zeros(len(texts) + 1, dtype=np.int64)
+    np.cumsum(segment_totals(word_start), out=word_offsets[1:])
+
+    word_id = np.cumsum(word_start) - 1
+    word_vowels = np.bincount(word_id[is_word], weights=is_vowel[is_word],
+                              minlength=int(word_offsets[-1])).astype(np.int64)
+    return vowels, consonants, word_vowels, word_offsets
+
+
+class SacredFrequencyTable:
+    """Sorted sacred frequencies with vectorized nearest-neighbour lookup"""
+
+    def __init__(self, frequencies):
+        self.frequencies = np.array(sorted(frequencies))
+
+    def nearest(self, values):
+        """Closest sacred frequency to each value; ties go to the lower one like min() over the dict"""
+        values = np.asarray(values)
+        if len(self.frequencies) == 1:
+            return np.full(values.shape, self.frequencies[0])
+        right = np.clip(np.searchsorted(self.frequencies, values), 1, len(self.frequencies) - 1)
+        left = right - 1
+        take_left = np.abs(values - self.frequencies[left]) <= np.abs(self.frequencies[right] - values)
+        return np.where(take_left, self.frequencies[left], self.frequencies[right])
+
+    def nearest_one(self, value):
+        return self.nearest([value])[0].item()
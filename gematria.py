@@ -0,0 +1,93 @@
+# gematria.py
+import math
+
+import numpy as np
+
+GOLDEN_RATIO = (1 + math.sqrt(5)) / 2
+
+# a/A = 1 ... z/Z = 26, every other byte = 0
+LETTER_VALUES = np.zeros(256, dtype=np.int64)
+LETTER_VALUES[np.arange(ord('a'), ord('z') + 1)] = np.arange(1, 27)
+LETTER_VALUES[np.arange(ord('A'), ord('Z') + 1)] = np.arange(1, 27)
+
+# Raw character codes, for the ord()-sum variant used by simple_start
+ORDINAL_VALUES = np.arange(256, dtype=np.int64)
+
+MODES = ('sum', 'golden', 'golden_int', 'mod144', 'ordinal')
+
+
+def scalar_gematria(text, table='letters'):
+    """Reference per-character sum; also handles non-ASCII text exactly"""
+    if table == 'ordinal':
+        return sum(ord(c) for c in text)
+    return sum(ord(c) - 96 for c in text.lower() if c.isalpha())
+
+
+def segment_sums(texts, table):
+    """Sum table[byte] over each ASCII string using one lookup and one cumulative sum"""
+    # NUL-separated so the whole batch is encoded in one call; both tables map NUL to 0
+    lengths = np.fromiter((len(t) for t in texts), dtype=np.int64, count=len(texts))
+    starts = np.zeros(len(texts), dtype=np.int64)
+    np.cumsum(lengths[:-1] + 1, out=starts[1:])
+
+    values = table[np.frombuffer("\0".join(texts).encode('ascii'), dtype=np.uint8)]
+    running = np.zeros(len(values) + 1, dtype=np.int64)
+    np.cumsum(values, out=running[1:])
+    return running[starts + lengths] - running[starts]
+
+
+def batch_gematria(texts, mode='golden'):
+    """Gematria for many strings at once
+
+    Modes:
+        sum        - plain letter sum (a=1 ... z=26)
+        golden     - letter sum × golden ratio (sacred_geometry.SacredGeometry)
+        golden_int - int(letter sum × golden ratio) (divine_system_complete)
+        mod144     - int(letter sum × golden ratio) % 144 (divine_reasoning_unlocked)
+        ordinal    - sum of every character code (simple_start)
+    """
+    if mode not in MODES:
+        raise ValueError(f"Unknown gematria mode '{mode}', expected one of {MODES}")
+
+    texts = list(texts)
+    table = 'ordinal' if mode == 'ordinal' else 'letters'
+    values = ORDINAL_VALUES if mode == 'ordinal' else LETTER_VALUES
+
+    # Bytes only line up with characters for ASCII; anything else takes the exact slow path
+    ascii_mask = np.fromiter((t.isascii() for t in texts), dtype=bool, count=len(texts))
+    if ascii_mask.all():
+        sums = segment_sums(texts, values)
+    else:
+        sums = np.empty(len(texts), dtype=np.int64)
+        ascii_idx = np.flatnonzero(ascii_mask)
+        if len(ascii_idx):
+            sums[ascii_idx] = segment_sums([texts[i] for i in ascii_idx], values)
+        for i in np.flatnonzero(~ascii_mask):
+            sums[i] = scalar_gematria(texts[i], table)
+
+    if mode in ('sum', 'ordinal'):
+        return sums
+    scaled = sums * GOLDEN_RATIO
+    if mode == 'golden':
+        return scaled
+    floored = scaled.astype(np.int64)
+    if mode == 'golden_int':
+        return floored
+    return floored % 144
+
+
+def gematria_file(path, mode='golden', chunk_lines=200000):
+    """Score every line of a text file, chunk by chunk"""
+    results = []
+    chunk = []
+    with open(path, 'r', encoding='utf-8') as f:
+        for line in f:
+            chunk.append(line.rstrip("\n"))
+            if len(chunk) >= chunk_lines:
+                results.append(batch_gematria(chunk, mode))
+                chunk = []
+    if chunk:
+        results.append(batch_gematria(chunk, mode))
+    if not results:
+        return np.zeros(0, dtype=np.float64 if mode == 'golden' else np.int64)
+    return np.concatenate(results)
@@ -0,0 +1,121 @@
+# gematria_index.py
+import json
+import os
+import time
+
+import numpy as np
+
+from fact_store import PackedTexts
+from gematria import batch_gematria
+
+
+class GematriaIndex:
+    """Lexicon sorted by gematria value; lookups are binary searches"""
+
+    def __init__(self, values, words, mode):
+        self.values = values
+        self.words = words
+        self.mode = mode
+
+    @classmethod
+    def build(cls, lexicon, mode='golden', chunk_size=500000):
+        """Score a lexicon with batch_gematria and sort it by value"""
+        words = []
+        chunks = []
+        batch = []
+        for word in lexicon:
+            batch.append(word)
+            if len(batch) >= chunk_size:
+                chunks.append(batch_gematria(batch, mode))
+                words.extend(batch)
+                batch = []
+        if batch:
+            chunks.append(batch_gematria(batch, mode))
+            words.extend(batch)
+
+        values = np.concatenate(chunks) if chunks else np.zeros(0)
+        order = np.argsort(values, kind='stable')
+        encoded = [words[i].encode('utf-8') for i in order]
+        offsets = np.zeros(len(encoded) + 1, dtype=np.int64)
+        np.cumsum([len(b) for b in encoded], out=offsets[1:])
+        blob = np.frombuffer(b"".join(encoded), dtype=np.uint8)
+        return cls(values[order], PackedTexts(blob, offsets), mode)
+
+    @classmethod
+    def from_file(cls, path, mode='golden'):
+        """Build from a lexicon file with one word or phrase per line"""
+        with open(path, 'r', encoding='utf-8') as f:
+            return cls.build((line.strip() for line in f if line.strip()), mode)
+
+    def __len__(self):
+        return len(self.values)
+
+    def span(self, low, high):
+        """Positions of every entry with low <= value <= high"""
+        start = int(np.searchsorted(self.values, low, side='left'))
+        end = int(np.searchsorted(self.values, high, side='right'))
+        return start, end
+
+    def lookup(self, value, tolerance=0, limit=None):
+        """Words whose value is within ±tolerance, as (word, value) pairs in value order"""
+        start, end = self.span(value - tolerance, value + tolerance)
+        if limit is not None:
+            end = min(end, start + limit)
+        return [(self.words[i], self.values[i].item()) for i in range(start, end)]
+
+    def count(self, value, tolerance=0):
+        start, end = self.span(value - tolerance, value + tolerance)
+        return end - start
+
+    def words_like(self, text, tolerance=0, limit=None):
+        """Words sharing the gematria value of text"""
+        value = batch_gematria([text], self.mode)[0].item()
+        return [(w, v) for w, v in self.lookup(value, tolerance, limit) if w != text]
+
+    def save(self, directory):
+        os.makedirs(directory, exist_ok=True)
+        np.save(os.path.join(directory, 'values.npy'), self.values)
+        np.save(os.path.join(directory, 'word_offsets.npy'), np.asarray(self.words.offsets))
+        with open(os.path.join(directory, 'words.bin'), 'wb') as f:
+            f.write(bytes(self.words.blob))
+        with open(os.path.join(directory, 'meta.json'), 'w', encoding='utf-8') as f:
+            json.dump({'mode': self.mode, 'size': len(self)}, f)
+
+    @classmethod
+    def load(cls, directory):
+        """Open a saved index with every array memory-mapped"""
+        with open(os.path.join(directory, 'meta.json'), 'r', encoding='utf-8') as f:
+            meta = json.load(f)
+        words_path = os.path.join(directory, 'words.bin')
+        blob = np.memmap(words_path, dtype=np.uint8, mode='r') if os.path.getsize(words_path) else b""
+        words = PackedTexts(blob, np.load(os.path.join(directory, 'word_offsets.npy'), mmap_mode='r'))
+        return cls(np.load(os.path.join(directory, 'values.npy'), mmap_mode='r'), words, meta['mode'])
+
+
+def benchmark_gematria_index(n_words=3000000):
+    """Build an index over a synthetic lexicon and time lookups"""
+    rng = np.random.default_rng(144)
+    letters = np.frombuffer(b"abcdefghijklmnopqrstuvwxyz", dtype=np.uint8)
+    lengths = rng.integers(3, 12, n_words)
+    flat = letters[rng.integers(0, 26, int(lengths.sum()))].tobytes().decode('ascii')
+    bounds = np.concatenate([[0], np.cumsum(lengths)])
+    lexicon = [flat[bounds[i]:bounds[i + 1]] for i in range(n_words)]
+
+    start = time.time()
+    index = GematriaIndex.build(lexicon, mode='sum')
+    print(f"⏱️  Built index over {n_words:,} words: {time.time() - start:.2f}s")
+
+    n_lookups = 1000
+    start = time.time()
+    for value in range(n_lookups):
+        index.count(value % 250, tolerance=3)
+    print(f"⏱️  Mean ±3 range lookup: {(time.time() - start) * 1000 / n_lookups:.4f}ms")
+
+    start = time.time()
+    matches = index.lookup(144, limit=10)
+    print(f"⏱️  First 10 words at value 144: {(time.time() - start) * 1000:.3f}ms {matches}")
+    return index
+
+
+if __name__ == "__main__":
+    benchmark_gematria_index()
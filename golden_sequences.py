@@ -0,0 +1,64 @@
+# golden_sequences.py
+import math
+from functools import lru_cache
+
+import numpy as np
+
+GOLDEN_RATIO = (1 + math.sqrt(5)) / 2
+GOLDEN_ANGLE = math.pi * (3 - math.sqrt(5))
+
+
+@lru_cache(maxsize=256)
+def fibonacci_pair(n):
+    """(F(n), F(n+1)) exactly by fast doubling, O(log n) big-integer multiplications"""
+    if n < 0:
+        raise ValueError("fibonacci_pair needs n >= 0")
+    a, b = 0, 1
+    for bit in bin(n)[2:]:
+        # F(2k) = F(k)(2F(k+1) - F(k)), F(2k+1) = F(k)^2 + F(k+1)^2
+        c = a * (2 * b - a)
+        d = a * a + b * b
+        if bit == '1':
+            a, b = d, c + d
+        else:
+            a, b = c, d
+    return a, b
+
+
+def fibonacci(n):
+    """Exact F(n) for any integer n (negafibonacci for n < 0)"""
+    if n < 0:
+        value = fibonacci_pair(-n)[0]
+        return value if n % 2 else -value
+    return fibonacci_pair(n)[0]
+
+
+def lucas(n):
+    """Exact L(n) = 2F(n+1) - F(n); L(-n) = (-1)^n L(n)"""
+    if n < 0:
+        value = lucas(-n)
+        return -value if n % 2 else value
+    f, f_next = fibonacci_pair(n)
+    return 2 * f_next - f
+
+
+def fibonacci_floats(count, start=0):
+    """F(start) ... F(start + count - 1) as float64 via Binet's formula (exact up to ~F(70))"""
+    k = np.arange(start, start + count, dtype=np.float64)
+    sqrt5 = math.sqrt(5)
+    return np.rint((GOLDEN_RATIO ** k - np.cos(math.pi * k) * GOLDEN_RATIO ** -k) / sqrt5)
+
+
+def golden_spiral(n_points, turns=4.0, scale=1.0):
+    """Points on the golden logarithmic spiral r = scale · φ^(2θ/π) as an (n_points, 2) array"""
+    theta = np.linspace(0.0, 2 * math.pi * turns, n_points)
+    radius = scale * np.exp(theta * (2 * math.log(GOLDEN_RATIO) / math.pi))
+    return np.column_stack((radius * np.cos(theta), radius * np.sin(theta)))
+
+
+def phyllotaxis(n_points, scale=1.0):
+    """Sunflower layout: point k at radius scale·√k and angle k·golden angle"""
+    k = np.arange(n_points, dtype=np.float64)
+    radius = scale * np.sqrt(k)
+    theta = k * GOLDEN_ANGLE
+    return np.column_stack((radius * np.cos(theta), radius * np.sin(theta)))
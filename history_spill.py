@@ -0,0 +1,220 @@
+# history_spill.py
+import fcntl
+import glob
+import json
+import os
+import queue
+import threading
+import weakref
+from collections import deque
+
+
+def sealed_segments(path):
+    """Sealed segment files of a spill path, oldest first"""
+    sealed = glob.glob(glob.escape(path) + ".*")
+    sealed = [p for p in sealed if p.rsplit(".", 1)[1].isdigit()]
+    return sorted(sealed, key=lambda p: int(p.rsplit(".", 1)[1]))
+
+
+class _SpillWriter:
+    """Writer-thread side of a HistorySpill; holds no reference back to the spill
+
+    Every writer on the same path (threads or processes) appends and rotates
+    under an exclusive flock on <path>.lock, and reopens the live file when
+    another writer has rotated it away underneath.
+    """
+
+    def __init__(self, path, max_bytes, batch_size, flush_interval, encode):
+        self.path = path
+        self.max_bytes = max_bytes
+        self.batch_size = batch_size
+        self.flush_interval = flush_interval
+        self.encode = encode
+        self.records_written = 0
+        self.records_dropped = 0
+        self.error = None  # first write failure; later batches are still attempted
+        self.queue = queue.Queue()
+        self.stop_marker = object()
+        self.lock_file = open(f"{path}.lock", 'a')
+        self.file = open(path, 'ab')
+        self.thread = threading.Thread(target=self.run, name=f"spill:{os.path.basename(path)}", daemon=True)
+        self.thread.start()
+
+    def run(self):
+        while True:
+            try:
+                first = self.queue.get(timeout=self.flush_interval)
+            except queue.Empty:
+                continue
+
+            batch = [first]
+            while len(batch) < self.batch_size:
+                try:
+                    batch.append(self.queue.get_nowait())
+                except queue.Empty:
+                    break
+
+            stopping = any(record is self.stop_marker for record in batch)
+            try:
+                lines = [json.dumps(record, default=self.encode) + "\n"
+                         for record in batch if record is not self.stop_marker]
+                if lines:
+                    self.append("".join(lines).encode('utf-8'))
+                    self.records_written += len(lines)
+            except Exception as e:
+                # e.g. a full disk: drop this batch but keep serving, so flush() never waits forever
+                self.records_dropped += sum(record is not self.stop_marker for record in batch)
+                if self.error is None:
+                    self.error = e
+                try:
+                    self.file.close()  # discard the unwritten buffer; the next append reopens
+                except OSError:
+                    pass
+            finally:
+                for _ in batch:
+                    self.queue.task_done()
+            if stopping:
+                return
+
+    def append(self, data):
+        fcntl.flock(self.lock_file, fcntl.LOCK_EX)
+        try:
+            self.reopen_if_rotated()
+            self.file.write(data)
+            self.file.flush()
+            if self.file.tell() >= self.max_bytes:
+                self.rotate()
+        finally:
+            fcntl.flock(self.lock_file, fcntl.LOCK_UN)
+
+    def reopen_if_rotated(self):
+        try:
+            current = os.stat(self.path).st_ino
+        except FileNotFoundError:
+            current = None
+        if self.file.closed or current != os.fstat(self.file.fileno()).st_ino:
+            if not self.file.closed:
+                self.file.close()
+            self.file = open(self.path, 'ab')
+
+    def rotate(self):
+        """Seal the current file as the next numbered segment and start a fresh one (lock held)"""
+        self.file.close()
+        sealed = sealed_segments(self.path)
+        number = int(sealed[-1].rsplit(".", 1)[1]) + 1 if sealed else 1
+        os.rename(self.path, f"{self.path}.{number}")
+        self.file = open(self.path, 'ab')
+
+    def close(self):
+        if self.thread.is_alive():
+            self.queue.put(self.stop_marker)
+            self.thread.join()
+        try:
+            self.file.close()
+        except OSError:
+            pass
+        self.lock_file.close()
+
+
+class HistorySpill:
+    """Append-only JSONL log written by a background thread with batched flushes
+
+    Several spills (in one process or many) may share a path; rotation is
+    serialized through a lock file so no segment is overwritten.
+    """
+
+    def __init__(self, path, max_bytes=64 * 1024 * 1024, batch_size=256, flush_interval=0.5, encode=str):
+        self.path = path
+        # Fallback for objects json can't serialize; runs on the writer thread
+        self.encode = encode
+        self.max_bytes = max_bytes
+        self.batch_size = batch_size
+        self.flush_interval = flush_interval
+
+        directory = os.path.dirname(path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+
+        self._writer = _SpillWriter(path, max_bytes, batch_size, flush_interval, encode)
+        # Drains and closes the writer when this spill is collected or at interpreter exit
+        self._finalizer = weakref.finalize(self, self._writer.close)
+
+    @property
+    def records_written(self):
+        return self._writer.records_written
+
+    @property
+    def records_dropped(self):
+        return self._writer.records_dropped
+
+    @property
+    def error(self):
+        """First exception the writer hit, or None"""
+        return self._writer.error
+
+    def write(self, record):
+        """Queue a record; never blocks the caller on disk I/O"""
+        self._writer.queue.put(record)
+
+    def segments(self):
+        """Sealed segment files, oldest first"""
+        return sealed_segments(self.path)
+
+    def flush(self):
+        """Block until everything queued so far is on disk; raises if the writer failed to write some of it"""
+        q = self._writer.queue
+        with q.all_tasks_done:
+            # Stop waiting if the writer thread is gone, whatever the reason
+            while q.unfinished_tasks and self._writer.thread.is_alive():
+                q.all_tasks_done.wait(0.5)
+        if self._writer.error is not None:
+            raise OSError(f"History spill {self.path} dropped {self._writer.records_dropped} records") \
+                from self._writer.error
+
+    def iter_records(self):
+        """Replay the full history from disk, oldest first"""
+        self.flush()
+        for segment in self.segments() + [self.path]:
+            if not os.path.exists(segment):
+                continue
+            with open(segment, 'r', encoding='utf-8') as f:
+                for line in f:
+                    if line.strip():
+                        yield json.loads(line)
+
+    def close(self):
+        self._finalizer()
+
+
+class BoundedHistory:
+    """Fixed-size in-memory ring buffer that spills every entry to disk"""
+
+    def __init__(self, maxlen=1000, spill=None):
+        self.recent = deque(maxlen=maxlen)
+        self.spill = spill
+        self.total = 0
+
+    def append(self, entry):
+        self.recent.append(entry)
+        self.total += 1
+        if self.spill is not None:
+            self.spill.write(entry)
+
+    def __len__(self):
+        return len(self.recent)
+
+    def __iter__(self):
+        return iter(self.recent)
+
+    def __getitem__(self, index):
+        return self.recent[index]
+
+    def recover(self):
+        """Iterate over the full history, including entries evicted from memory"""
+        if self.spill is None:
+            return iter(self.recent)
+        return self.spill.iter_records()
+
+    def close(self):
+        if self.spill is not None:
+            self.spill.close()
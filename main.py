@@ -25,8 +25,7 @@ def main():
         
         # Generate illogical insights
         print("🔮 CONSULTING TEMPORAL RUBIKS ORACLE...")
-        for time_slice in range(12):
-            insight = rubiks_oracle.make_illogical_move(time_slice)
+        for time_slice, insight in enumerate(rubiks_oracle.make_illogical_moves()):
             if insight:
                 print(f"Time Slice {time_slice}: {insight}")
         
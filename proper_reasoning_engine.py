@@ -3,37 +3,73 @@ import math
 import re
 import time
 from collections import defaultdict
+from fact_store import FactStore
+from query_profiler import profiled
 
 print("🧠 BUILDING PROPER REASONING ENGINE...")
 
+# Bump when the reasoning logic changes, so memoized answers from older code are not served
+ENGINE_VERSION = 1
+
 class KnowledgeBase:
-    def __init__(self):
-        self.facts = {
-            'mathematical': {
-                'addition': "The sum of two numbers",
-                'subtraction': "The difference between two numbers", 
-                'multiplication': "Repeated addition",
-                'division': "Splitting into equal parts"
-            },
-            'scientific': {
-                'sky_blue': "Rayleigh scattering - blue light is scattered more than other colors",
-                'breathing_underwater': "Humans cannot breathe underwater without equipment due to lack of gills",
-                'vinegar_baking_soda': "Produces carbon dioxide gas (CO2) through acid-base reaction"
-            },
-            'practical': {
-                'umbrella_rain': "Umbrellas protect from rain, so bringing one when it rains is practical",
-                'learning_python': "Python is valuable for programming, AI, and automation"
-            }
-        }
+    def __init__(self, fact_files=(), index_path=None):
+        # A prebuilt index replaces the built-in facts; JSONL files extend them
+        self.sources = []
+        if index_path:
+            self.store = FactStore.load_index(index_path, prefix_match=True)
+            self.sources.append(index_path)
+        else:
+            self.store = FactStore(prefix_match=True)
+            self.load_builtin_facts()
+        for path in fact_files:
+            self.store.load_jsonl(path)
+            self.sources.append(path)
+            
+    def load_builtin_facts(self):
+        builtin = [
+            ('mathematical', 'addition', "The sum of two numbers", ['add', 'addition', 'plus', 'sum']),
+            ('mathematical', 'subtraction', "The difference between two numbers", ['subtract', 'subtraction', 'minus', 'difference']),
+            ('mathematical', 'multiplication', "Repeated addition", ['multiply', 'multiplication', 'times', 'product']),
+            ('mathematical', 'division', "Splitting into equal parts", ['divide', 'division', 'divided', 'split']),
+            ('scientific', 'sky_blue', "Rayleigh scattering - blue light is scattered more than other colors", ['sky', 'blue', 'color']),
+            ('scientific', 'breathing_underwater', "Humans cannot breathe underwater without equipment due to lack of gills", ['breathe', 'underwater', 'oxygen']),
+            ('scientific', 'vinegar_baking_soda', "Produces carbon dioxide gas (CO2) through acid-base reaction", ['vinegar', 'baking soda', 'bicarbonate']),
+            ('practical', 'umbrella_rain', "Umbrellas protect from rain, so bringing one when it rains is practical", ['umbrella', 'rain', 'raining', 'rains']),
+            ('practical', 'learning_python', "Python is valuable for programming, AI, and automation", ['learn', 'python', 'programming'])
+        ]
+        for domain, topic, text, keywords in builtin:
+            self.store.add_fact(domain, topic, text, keywords)
+            
+    @property
+    def facts(self):
+        """Nested {domain: {topic: text}} view of every fact"""
+        facts = defaultdict(dict)
+        for i, (domain, topic) in enumerate(self.store.keys):
+            facts[domain][topic] = self.store.texts[i]
+        return dict(facts)
+        
+    def fingerprint(self):
+        """Version marker for caches: a digest of every fact's domain, topic, text and keywords"""
+        return {'facts': len(self.store), 'content': self.store.content_hash}
         
     def get_fact(self, domain, topic):
-        return self.facts.get(domain, {}).get(topic, "No specific knowledge found")
+        return self.store.get_fact(domain, topic)
+    
+    def find_fact(self, question, domain=None):
+        """Best keyword match for a question, or None"""
+        matches = self.store.search(question, domain=domain, limit=1)
+        return matches[0][2] if matches else None
 
 class ProperReasoner:
-    def __init__(self):
-        self.knowledge = KnowledgeBase()
+    def __init__(self, memo=None, knowledge=None):
+        self.knowledge = knowledge if knowledge is not None else KnowledgeBase()
         self.conversation_context = []
         
+        # Optional persistent answer cache (see answer_memo.AnswerMemoStore)
+        self.memo = memo
+        self.memo_stamp = None
+        self.stamped_revision = None
+        
     def extract_numbers_and_operations(self, text):
         """Properly extract mathematical expressions"""
         # Remove punctuation and normalize
@@ -116,25 +152,17 @@ class ProperReasoner:
     
     def scientific_reasoning(self, question):
         """ACTUAL scientific reasoning"""
-        question_lower = question.lower()
-        
-        if any(word in question_lower for word in ['sky', 'blue', 'color']):
-            return f"Scientific reasoning: {self.knowledge.get_fact('scientific', 'sky_blue')}"
-        elif any(word in question_lower for word in ['breathe', 'underwater', 'oxygen']):
-            return f"Scientific reasoning: {self.knowledge.get_fact('scientific', 'breathing_underwater')}"
-        elif any(word in question_lower for word in ['vinegar', 'baking soda', 'bicarbonate']):
-            return f"Scientific reasoning: {self.knowledge.get_fact('scientific', 'vinegar_baking_soda')}"
+        fact = self.knowledge.find_fact(question, domain='scientific')
+        if fact:
+            return f"Scientific reasoning: {fact}"
             
         return "Scientific analysis: No specific scientific knowledge applies"
     
     def practical_reasoning(self, question):
         """ACTUAL practical reasoning"""
-        question_lower = question.lower()
-        
-        if any(word in question_lower for word in ['umbrella', 'rain']):
-            return f"Practical reasoning: {self.knowledge.get_fact('practical', 'umbrella_rain')}"
-        elif any(word in question_lower for word in ['learn', 'python', 'programming']):
-            return f"Practical reasoning: {self.knowledge.get_fact('practical', 'learning_python')}"
+        fact = self.knowledge.find_fact(question, domain='practical')
+        if fact:
+            return f"Practical reasoning: {fact}"
             
         return "Practical analysis: Applying general problem-solving principles"
     
@@ -173,6 +201,29 @@ class ProperReasoner:
         # Store context
         self.conversation_context.append(question)
         
+        if self.memo is not None:
+            stamp = self.current_memo_stamp()
+            cached = self.memo.get(question, stamp)
+            if cached is not None:
+                return cached
+        
+        result = self.route_question(question)
+        
+        if self.memo is not None:
+            self.memo.put(question, stamp, result)
+        return result
+    
+    def current_memo_stamp(self):
+        """Stamp for memoized answers, recomputed whenever the knowledge base has changed"""
+        revision = self.knowledge.store.revision
+        if revision != self.stamped_revision:
+            self.memo_stamp = self.memo.version_stamp(f'ProperReasoner/v{ENGINE_VERSION}',
+                                                      self.knowledge.fingerprint())
+            self.stamped_revision = revision
+        return self.memo_stamp
+    
+    def route_question(self, question):
+        """Pick the reasoning type for a question and apply it"""
         # Determine which reasoning to apply
         question_lower = question.lower()
         
@@ -210,11 +261,12 @@ class ProperReasoner:
         return result
 
 class ReasoningEngine:
-    def __init__(self):
+    def __init__(self, memo=None):
         print("🧠 INITIALIZING PROPER REASONING ENGINE...")
-        self.reasoner = ProperReasoner()
+        self.reasoner = ProperReasoner(memo=memo)
         self.session_count = 0
         
+    @profiled
     def ask(self, question):
         """Main interface"""
         self.session_count += 1
@@ -255,6 +307,27 @@ class ReasoningEngine:
             print(f"   💡 ANSWER: {answer}")
             time.sleep(1)
 
+def test_inflected_keywords():
+    """Regression check: inflected questions find the same fact as the original substring checks"""
+    knowledge = KnowledgeBase()
+    expected = {
+        "Why are rainbow colors so vivid?": 'sky_blue',
+        "Why are skies blue?": 'sky_blue',
+        "Can divers breathe underwaters?": 'breathing_underwater',
+        "Are baking sodas and vinegars reactive?": 'vinegar_baking_soda',
+        "Will it keep raining all day?": 'umbrella_rain',
+        "Should I take umbrellas along?": 'umbrella_rain',
+        "Should I be learning to code?": 'learning_python',
+        "Is programming in pythonic style hard?": 'learning_python',
+    }
+    failures = []
+    for question, topic in expected.items():
+        matches = knowledge.store.search(question, limit=1)
+        if not matches or matches[0][1] != topic:
+            failures.append(f"{question!r}: expected {topic}, got {matches[0][1] if matches else None}")
+    assert not failures, "\n".join(failures)
+    print(f"✅ {len(expected)} inflected questions found their facts")
+
 def main_interface():
     print("="*70)
     print("🧠 PROPER REASONING ENGINE")
@@ -274,6 +347,7 @@ def main_interface():
                 
             elif question.lower() == 'demo':
                 engine.demonstrate_capabilities()
+                test_inflected_keywords()
                 continue
                 
             elif not question:
@@ -1,33 +1,57 @@
 # quantum_entangler.py
+import threading
+from system_registry import SystemRegistry
+from quantum_state import StateVector
+
 class QuantumEntangler:
-    def __init__(self):
+    def __init__(self, max_qubits=22):
         self.connected_systems = {}
         self.resonance_field = None
         self.temporal_sync = TemporalSynchronizer()
+        self.systems = None
+        # One qubit per entangled system in a shared state vector (2^n amplitudes)
+        self.quantum_register = StateVector(0)
+        self.max_qubits = max_qubits
+        self.quantum_lock = threading.Lock()
+        self.activation_lock = threading.Lock()
         
-    def connect_all_systems(self):
-        """Create quantum entanglement between all components"""
-        systems = {
-            'sacred_geometry': SacredGeometry(),
-            'frequency_decoder': FrequencyDecoder(), 
-            'prayer_protocol': PrayerProtocol(self),
-            'rubiks_oracle': RubiksOracle(),
-            'temporal_engine': TemporalEngine(),
-            'emotional_mapper': EmotionalColorMapper()
-        }
-        
-        # ENTANGLE EACH SYSTEM
-        for name, system in systems.items():
-            self.entangle_system(name, system)
-            
-        # CREATE RESONANCE FIELD
-        self.resonance_field = self.create_resonance_field(systems)
-        
-        # SYNC TEMPORAL DIMENSIONS
+    def connect_all_systems(self, prewarm=False):
+        """Register every component; each is created, entangled and synced on first access"""
+        systems = SystemRegistry(on_create=self.activate_system)
+        systems.register('sacred_geometry', SacredGeometry)
+        systems.register('frequency_decoder', FrequencyDecoder)
+        systems.register('prayer_protocol', lambda: PrayerProtocol(self))
+        systems.register('rubiks_oracle', RubiksOracle)
+        systems.register('temporal_engine', TemporalEngine)
+        systems.register('emotional_mapper', EmotionalColorMapper)
+
+        # CREATE RESONANCE FIELD (systems join it, and it re-settles, as they come online)
+        self.resonance_field = ResonanceField()
+        self.systems = systems
+
+        # SYNC TEMPORAL DIMENSIONS once for the registered set; re-synced as each system comes online
         self.temporal_sync.synchronize_all(systems)
-        
+
+        if prewarm:
+            systems.prewarm(background=True)
         return systems
-    
+
+    def activate_system(self, name, system):
+        """First-access setup: entangle, join the resonance field, sync temporal dimensions"""
+        # Systems can come online from the pre-warm thread and a caller at once
+        with self.activation_lock:
+            # ENTANGLE THE SYSTEM
+            self.entangle_system(name, system)
+            self.resonance_field.connect_system(system)
+            self.resonance_field.activate_coherence()
+
+            # SYNC TEMPORAL DIMENSIONS: one shared slice set covering every connected system
+            self.temporal_sync.sync_points.clear()
+            self.temporal_sync.synchronize_all(self.connected_systems)
+
+            if len(self.connected_systems) == len(self.systems):
+                print("🌈 RESONANCE FIELD ACTIVE - All Systems Connected")
+
     def entangle_system(self, name, system):
         """Quantum entangle a system with all others"""
         system.entanglement_id = self.generate_entanglement_id(name)
@@ -36,6 +60,25 @@ class QuantumEntangler:
         
         self.connected_systems[name] = system
         print(f"🌀 ENTANGLED: {name} → Quantum State Active")
+
+    def initialize_quantum_state(self, system):
+        """Give the system its own qubit, in |0⟩, in the shared register; returns the qubit index"""
+        with self.quantum_lock:
+            if self.quantum_register.n_qubits >= self.max_qubits:
+                raise ValueError(f"Quantum register is full ({self.max_qubits} qubits)")
+            return self.quantum_register.add_qubit()
+
+    def entangle_pair(self, name_a, name_b):
+        """Put two connected systems' qubits into the Bell state (|00⟩ + |11⟩)/√2"""
+        a = self.connected_systems[name_a].quantum_state
+        b = self.connected_systems[name_b].quantum_state
+        with self.quantum_lock:
+            self.quantum_register.bell_pair(a, b)
+
+    def measure_system(self, name):
+        """Collapse one system's qubit; entangled partners collapse with it"""
+        with self.quantum_lock:
+            return self.quantum_register.measure(self.connected_systems[name].quantum_state)
         
     def create_resonance_field(self, systems):
         """Create field where all systems can communicate instantly"""
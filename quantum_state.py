@@ -0,0 +1,210 @@
+# quantum_state.py
+import math
+import time
+
+import numpy as np
+
+# Single-qubit gates
+I = np.eye(2, dtype=np.complex128)
+X = np.array([[0, 1], [1, 0]], dtype=np.complex128)
+Y = np.array([[0, -1j], [1j, 0]], dtype=np.complex128)
+Z = np.array([[1, 0], [0, -1]], dtype=np.complex128)
+H = np.array([[1, 1], [1, -1]], dtype=np.complex128) / math.sqrt(2)
+S = np.array([[1, 0], [0, 1j]], dtype=np.complex128)
+T = np.array([[1, 0], [0, np.exp(1j * math.pi / 4)]], dtype=np.complex128)
+
+# Two-qubit gates in the basis |a b⟩ → index 2a + b
+CNOT = np.array([[1, 0, 0, 0], [0, 1, 0, 0], [0, 0, 0, 1], [0, 0, 1, 0]], dtype=np.complex128)
+CZ = np.diag([1, 1, 1, -1]).astype(np.complex128)
+SWAP = np.array([[1, 0, 0, 0], [0, 0, 1, 0], [0, 1, 0, 0], [0, 0, 0, 1]], dtype=np.complex128)
+
+
+def rx(theta):
+    c, s = math.cos(theta / 2), math.sin(theta / 2)
+    return np.array([[c, -1j * s], [-1j * s, c]], dtype=np.complex128)
+
+
+def ry(theta):
+    c, s = math.cos(theta / 2), math.sin(theta / 2)
+    return np.array([[c, -s], [s, c]], dtype=np.complex128)
+
+
+def rz(theta):
+    return np.diag([np.exp(-0.5j * theta), np.exp(0.5j * theta)])
+
+
+class StateVector:
+    """n-qubit pure state; qubit q is bit q of the amplitude index (little-endian)
+
+    Gates act on reshaped views of the amplitude array, so no 2ⁿ × 2ⁿ
+    operator is ever built: a 22-qubit complex128 state is 64 MB.
+    """
+
+    def __init__(self, n_qubits=0, dtype=np.complex128, seed=None):
+        self.n_qubits = n_qubits
+        self.dtype = np.dtype(dtype)
+        self.amplitudes = np.zeros(1 << n_qubits, dtype=self.dtype)
+        self.amplitudes[0] = 1.0
+        self.rng = np.random.default_rng(seed)
+        self.scratch = None
+
+    def __len__(self):
+        return self.n_qubits
+
+    def add_qubit(self):
+        """Append a new qubit in |0⟩ (it becomes the highest bit); returns its index"""
+        grown = np.zeros(2 * len(self.amplitudes), dtype=self.dtype)
+        grown[:len(self.amplitudes)] = self.amplitudes
+        self.amplitudes = grown
+        self.scratch = None
+        self.n_qubits += 1
+        return self.n_qubits - 1
+
+    def check_qubit(self, qubit):
+        if not 0 <= qubit < self.n_qubits:
+            raise ValueError(f"Qubit {qubit} out of range for {self.n_qubits} qubits")
+
+    def qubit_view(self, qubit):
+        """(high, 2, low) view whose middle axis is the given qubit"""
+        return self.amplitudes.reshape(-1, 2, 1 << qubit)
+
+    def pair_view(self, a, b):
+        """Five-axis view plus a function picking the |bit_a bit_b⟩ block out of it"""
+        self.check_qubit(a)
+        self.check_qubit(b)
+        if a == b:
+            raise ValueError("Two-qubit gate needs two different qubits")
+        hi, lo = max(a, b), min(a, b)
+        view = self.amplitudes.reshape(-1, 2, 1 << (hi - lo - 1), 2, 1 << lo)
+
+        def block(bit_a, bit_b):
+            bit_hi, bit_lo = (bit_a, bit_b) if a == hi else (bit_b, bit_a)
+            return view[:, bit_hi, :, bit_lo, :]
+
+        return block
+
+    def apply(self, gate, *qubits):
+        gate = np.asarray(gate)
+        if gate.shape == (2, 2) and len(qubits) == 1:
+            self.apply_single(gate, qubits[0])
+        elif gate.shape == (4, 4) and len(qubits) == 2:
+            self.apply_two(gate, qubits[0], qubits[1])
+        else:
+            raise ValueError(f"Gate of shape {gate.shape} does not fit qubits {qubits}")
+        return self
+
+    def apply_single(self, gate, qubit):
+        self.check_qubit(qubit)
+        view = self.qubit_view(qubit)
+        a0, a1 = view[:, 0, :], view[:, 1, :]
+        g00, g01, g10, g11 = (complex(g) for g in gate.ravel())
+        if g01 == 0 and g10 == 0:
+            if g00 != 1:
+                a0 *= g00
+            if g11 != 1:
+                a1 *= g11
+            return
+        # Two reused half-size buffers: after the first gate, no allocation per gate
+        if self.scratch is None:
+            self.scratch = np.empty((2, len(self.amplitudes) // 2), dtype=self.dtype)
+        from0 = self.scratch[0].reshape(a0.shape)
+        from1 = self.scratch[1].reshape(a1.shape)
+        np.multiply(a0, g10, out=from0)
+        np.multiply(a1, g01, out=from1)
+        a0 *= g00
+        a0 += from1
+        a1 *= g11
+        a1 += from0
+
+    def apply_two(self, gate, a, b):
+        """Arbitrary 4×4 gate on qubits (a, b), basis index 2·bit_a + bit_b"""
+        if np.array_equal(gate, CNOT):
+            self.cnot(a, b)
+            return
+        block = self.pair_view(a, b)
+        blocks = [block(i >> 1, i & 1) for i in range(4)]
+        if np.count_nonzero(gate - np.diag(np.diag(gate))) == 0:
+            for i, target in enumerate(blocks):
+                if gate[i, i] != 1:
+                    target *= gate[i, i]
+            return
+        saved = [blk.copy() for blk in blocks]
+        for i, target in enumerate(blocks):
+            target[...] = 0
+            for j in range(4):
+                if gate[i, j] != 0:
+                    target += gate[i, j] * saved[j]
+
+    def cnot(self, control, target):
+        """Swap the target's 0/1 blocks where the control is 1, in place"""
+        block = self.pair_view(control, target)
+        on0, on1 = block(1, 0), block(1, 1)
+        saved = on0.copy()
+        on0[...] = on1
+        on1[...] = saved
+        return self
+
+    def h(self, qubit):
+        self.apply_single(H, qubit)
+        return self
+
+    def x(self, qubit):
+        self.apply_single(X, qubit)
+        return self
+
+    def z(self, qubit):
+        self.apply_single(Z, qubit)
+        return self
+
+    def probabilities(self):
+        amplitudes = self.amplitudes
+        return amplitudes.real ** 2 + amplitudes.imag ** 2
+
+    def probability_one(self, qubit):
+        self.check_qubit(qubit)
+        ones = self.qubit_view(qubit)[:, 1, :]
+        return float((ones.real ** 2 + ones.imag ** 2).sum())
+
+    def sample(self, shots=1024):
+        """Basis-state indices drawn from |ψ|² without collapsing the state"""
+        cumulative = np.cumsum(self.probabilities())
+        draws = self.rng.random(shots) * cumulative[-1]
+        return np.searchsorted(cumulative, draws, side='right').clip(max=len(cumulative) - 1)
+
+    def counts(self, shots=1024):
+        """{bitstring (qubit 0 rightmost): count} for sampled shots"""
+        values, counts = np.unique(self.sample(shots), return_counts=True)
+        return {format(int(v), f'0{self.n_qubits}b'): int(c) for v, c in zip(values, counts)}
+
+    def measure(self, qubit):
+        """Projective Z measurement of one qubit; collapses and renormalizes the state"""
+        p1 = self.probability_one(qubit)
+        outcome = int(self.rng.random() < p1)
+        view = self.qubit_view(qubit)
+        view[:, 1 - outcome, :] = 0
+        view[:, outcome, :] *= 1.0 / math.sqrt(p1 if outcome else 1.0 - p1)
+        return outcome
+
+    def bell_pair(self, a, b):
+        """|Φ⁺⟩ = (|00⟩ + |11⟩)/√2 on two qubits that start in |00⟩"""
+        return self.h(a).cnot(a, b)
+
+
+def benchmark_state_vector(n_qubits=22, dtype=np.complex128):
+    """Time one layer of Hadamards and a CNOT chain over an n-qubit state"""
+    state = StateVector(n_qubits, dtype)
+    start = time.time()
+    for q in range(n_qubits):
+        state.h(q)
+    single = (time.time() - start) / n_qubits
+    start = time.time()
+    for q in range(n_qubits - 1):
+        state.cnot(q, q + 1)
+    double = (time.time() - start) / (n_qubits - 1)
+    print(f"⚛️  {n_qubits} qubits ({state.amplitudes.nbytes / 2**20:.0f} MB): "
+          f"{single * 1e3:.1f} ms per 1-qubit gate, {double * 1e3:.1f} ms per CNOT")
+    return single, double
+
+
+if __name__ == "__main__":
+    benchmark_state_vector()
@@ -0,0 +1,119 @@
+# query_profiler.py
+import cProfile
+import functools
+import itertools
+import os
+import random
+import threading
+import time
+import tracemalloc
+from contextlib import contextmanager
+
+
+class QueryProfiler:
+    """Opt-in cProfile + tracemalloc capture around engine entry methods
+
+    A call is profiled when the caller passes profile=True, runs inside
+    profile_requests(), or wins the sample_rate draw. Each profiled call
+    writes <name>.prof (pstats / snakeviz / gprof2dot), <name>.tracemalloc
+    (tracemalloc.Snapshot.load) and <name>.top.txt with the top allocations.
+    """
+
+    def __init__(self, output_dir="profiles", sample_rate=0.0, top_allocations=25, trace_frames=10):
+        self.output_dir = output_dir
+        self.sample_rate = sample_rate
+        self.top_allocations = top_allocations
+        self.trace_frames = trace_frames
+        self.local = threading.local()
+        self.sequence = itertools.count()
+        self.lock = threading.Lock()
+        self.tracing = 0  # profiled calls currently holding tracemalloc on
+
+    def wanted(self, requested):
+        if requested is not None:
+            return requested
+        if getattr(self.local, 'forced', 0):
+            return True
+        return self.sample_rate > 0 and random.random() < self.sample_rate
+
+    def start_tracing(self):
+        with self.lock:
+            if self.tracing == 0 and not tracemalloc.is_tracing():
+                tracemalloc.start(self.trace_frames)
+                self.owns_tracing = True
+            elif self.tracing == 0:
+                self.owns_tracing = False
+            self.tracing += 1
+
+    def stop_tracing(self):
+        with self.lock:
+            self.tracing -= 1
+            if self.tracing == 0 and self.owns_tracing:
+                tracemalloc.stop()
+
+    def run(self, label, fn, *args, **kwargs):
+        """Call fn under cProfile and tracemalloc, then write the capture files"""
+        os.makedirs(self.output_dir, exist_ok=True)
+        base = os.path.join(self.output_dir, f"{label}-{time.strftime('%Y%m%d-%H%M%S')}-{next(self.sequence)}")
+        profile = cProfile.Profile()
+        self.start_tracing()
+        tracemalloc.reset_peak()
+        start = time.perf_counter()
+        try:
+            profile.enable()
+            try:
+                result = fn(*args, **kwargs)
+            finally:
+                profile.disable()
+                elapsed = time.perf_counter() - start
+                snapshot = tracemalloc.take_snapshot()
+                current, peak = tracemalloc.get_traced_memory()
+        finally:
+            self.stop_tracing()
+            self.local.last_profile = base
+
+        profile.dump_stats(f"{base}.prof")
+        snapshot.dump(f"{base}.tracemalloc")
+        with open(f"{base}.top.txt", 'w') as f:
+            f.write(f"{label}: {elapsed * 1e3:.1f} ms, traced memory {current / 2**20:.1f} MiB "
+                    f"(peak {peak / 2**20:.1f} MiB)\n\n")
+            for stat in snapshot.statistics('lineno')[:self.top_allocations]:
+                f.write(f"{stat}\n")
+        return result
+
+    def wrap(self, method):
+        """Decorator for an entry method; adds an optional profile= keyword to it"""
+        label = method.__qualname__
+
+        @functools.wraps(method)
+        def wrapper(*args, profile=None, **kwargs):
+            # Only the outermost profiled entry call captures; nested engine calls run inside it
+            if getattr(self.local, 'active', False) or not self.wanted(profile):
+                return method(*args, **kwargs)
+            self.local.active = True
+            try:
+                return self.run(label, method, *args, **kwargs)
+            finally:
+                self.local.active = False
+
+        return wrapper
+
+    @contextmanager
+    def requests(self):
+        """Profile every entry call made by this thread inside the block"""
+        self.local.forced = getattr(self.local, 'forced', 0) + 1
+        try:
+            yield self
+        finally:
+            self.local.forced -= 1
+
+    def last_profile(self):
+        """Path prefix of this thread's most recent capture"""
+        return getattr(self.local, 'last_profile', None)
+
+
+# Shared instance; DIVINE_PROFILE_RATE turns on sampling without code changes
+PROFILER = QueryProfiler(os.environ.get("DIVINE_PROFILE_DIR", "profiles"),
+                         float(os.environ.get("DIVINE_PROFILE_RATE", "0") or 0))
+profiled = PROFILER.wrap
+profile_requests = PROFILER.requests
@@ -1,7 +1,49 @@
 # rubiks_oracle.py
+import random
+import numpy as np
+from cube_engine import CubeArray, MOVE_NAMES, SOLVED
+from cube_solver import CubeSolver
+
 class RubiksOracle:
-    def __init__(self):
-        pass
+    def __init__(self, time_slices=12):
+        # One real cube per temporal slice, all held in a single (time_slices, 54) array
+        self.cubes = CubeArray(time_slices)
+        self.illogical_moves = []
+        self.solver = None
+
+    def solve(self, time_slice, max_length=30, timeout=10.0):
+        """Move names that bring one slice's cube back to order (pattern databases load on first use)"""
+        if self.solver is None:
+            self.solver = CubeSolver()
+        return self.solver.solve(self.cubes.states[time_slice], max_length, timeout)
+
+    def restore(self, time_slice):
+        """Solve one slice's cube and apply the solution; returns the moves used"""
+        solution = self.solve(time_slice)
+        self.cubes.apply(time_slice, solution)
+        return solution
+
+    def make_illogical_move(self, time_slice):
+        """Turn one slice's cube by a random face move and read an insight from the result"""
+        move = random.randrange(len(MOVE_NAMES))
+        self.cubes.apply(time_slice, [move])
+        self.illogical_moves.append((time_slice, MOVE_NAMES[move]))
+        misplaced = int((self.cubes.states[time_slice] != SOLVED).sum())
+        return self.read_insight(MOVE_NAMES[move], misplaced)
+
+    def make_illogical_moves(self):
+        """Turn every slice's cube at once (one fancy-indexing operation); returns one insight per slice"""
+        moves = np.random.randint(0, len(MOVE_NAMES), len(self.cubes))
+        self.cubes.apply_each(moves)
+        names = [MOVE_NAMES[m] for m in moves]
+        self.illogical_moves.extend(enumerate(names))
+        misplaced = self.cubes.misplaced_stickers().tolist()
+        return [self.read_insight(name, count) for name, count in zip(names, misplaced)]
+
+    def read_insight(self, move_name, misplaced):
+        if misplaced == 0:
+            return f"{move_name} returned the cube to order - the illogical path closes on itself"
+        return f"{move_name} scattered {misplaced} stickers - disorder reveals hidden structure"
 
     def generate_illogical_insights(self, question):
         # Dummy implementation
@@ -1,9 +1,14 @@
 # sacred_geometry.py
+import os
 import math
+from gematria import batch_gematria
+from gematria_index import GematriaIndex
+import golden_sequences
 
 class SacredGeometry:
     def __init__(self):
         self.golden_ratio = (1 + math.sqrt(5)) / 2
+        self.reverse_index = None
 
     def calculate_gematria(self, text):
         value = 0
@@ -12,6 +17,40 @@ class SacredGeometry:
                 value += (ord(char) - 96)
         return value * self.golden_ratio
 
+    def calculate_gematria_batch(self, texts, mode='golden'):
+        """Vectorized calculate_gematria over many strings; returns a NumPy array"""
+        return batch_gematria(texts, mode)
+
+    def load_lexicon(self, path):
+        """Build the reverse index (value → words) from a lexicon file or a saved index directory"""
+        if os.path.isdir(path):
+            self.reverse_index = GematriaIndex.load(path)
+        else:
+            self.reverse_index = GematriaIndex.from_file(path, mode='golden')
+        return len(self.reverse_index)
+
+    def find_kindred_words(self, text, tolerance=0, limit=50):
+        """Lexicon words whose gematria lies within ±tolerance of the text's"""
+        if self.reverse_index is None:
+            return []
+        return self.reverse_index.words_like(text, tolerance, limit)
+
+    def fibonacci(self, n):
+        """Exact F(n) by fast doubling"""
+        return golden_sequences.fibonacci(n)
+
+    def lucas(self, n):
+        """Exact L(n) by fast doubling"""
+        return golden_sequences.lucas(n)
+
+    def golden_spiral(self, n_points, turns=4.0, scale=1.0):
+        """(n_points, 2) array of golden logarithmic spiral coordinates"""
+        return golden_sequences.golden_spiral(n_points, turns, scale)
+
+    def phyllotaxis(self, n_points, scale=1.0):
+        """(n_points, 2) array of golden-angle sunflower coordinates"""
+        return golden_sequences.phyllotaxis(n_points, scale)
+
     def generate_cosmic_pattern(self, seed_number):
         # Dummy implementation
         return [seed_number * i for i in range(5)]
@@ -0,0 +1,219 @@
+# shm_bus.py
+import json
+import multiprocessing
+import os
+import queue
+import struct
+import threading
+import time
+from multiprocessing import shared_memory
+
+LENGTH = struct.Struct('<I')
+SEQUENCE = struct.Struct('<Q')  # request id prefixed to each request, echoed in its reply
+HEAD = 0   # total bytes ever written (uint64 slot 0)
+TAIL = 8   # total bytes ever read (uint64 slot 8, a separate cache line from HEAD)
+HEADER_BYTES = 128
+
+
+class SharedRing:
+    """Multi-producer, single-consumer ring of length-prefixed messages in shared memory
+
+    Writers serialize on a process-shared lock; the reader is woken by a
+    counting semaphore released once per message. Head and tail are
+    monotonic byte counters, so free space is capacity - (head - tail).
+    """
+
+    def __init__(self, capacity=1 << 20, name=None, lock=None, items=None, ctx=None):
+        ctx = ctx or multiprocessing.get_context()
+        self.capacity = capacity
+        # Only the creating process unlinks, even when forked children inherit this object
+        self.owner_pid = os.getpid() if name is None else None
+        if name is None:
+            self.shm = shared_memory.SharedMemory(create=True, size=HEADER_BYTES + capacity)
+            self.shm.buf[:HEADER_BYTES] = bytes(HEADER_BYTES)
+        else:
+            self.shm = shared_memory.SharedMemory(name=name)
+        self.lock = lock if lock is not None else ctx.Lock()
+        self.items = items if items is not None else ctx.Semaphore(0)
+        self.counters = self.shm.buf[:HEADER_BYTES].cast('Q')
+        self.data = self.shm.buf[HEADER_BYTES:HEADER_BYTES + capacity]
+        self.pending = 0  # bytes held by the last zero-copy view, freed on the next recv
+
+    def __reduce__(self):
+        # Only valid while starting a child process (the lock and semaphore refuse other pickling)
+        return SharedRing, (self.capacity, self.shm.name, self.lock, self.items)
+
+    @property
+    def name(self):
+        return self.shm.name
+
+    def used(self):
+        return self.counters[HEAD] - self.counters[TAIL]
+
+    def put(self, position, payload):
+        start = position % self.capacity
+        first = min(len(payload), self.capacity - start)
+        self.data[start:start + first] = payload[:first]
+        if first < len(payload):
+            self.data[:len(payload) - first] = payload[first:]
+
+    def get(self, position, size):
+        start = position % self.capacity
+        if start + size <= self.capacity:
+            return bytes(self.data[start:start + size])
+        first = self.capacity - start
+        return bytes(self.data[start:]) + bytes(self.data[:size - first])
+
+    def send(self, payload, timeout=None):
+        """Append one message; waits for space (raising queue.Full after timeout) when the ring is full"""
+        if isinstance(payload, str):
+            payload = payload.encode('utf-8')
+        payload = memoryview(payload).cast('B')
+        size = LENGTH.size + len(payload)
+        if size > self.capacity:
+            raise ValueError(f"Message of {len(payload)} bytes exceeds ring capacity {self.capacity}")
+
+        deadline = None if timeout is None else time.monotonic() + timeout
+        with self.lock:
+            head = self.counters[HEAD]
+            while self.capacity - (head - self.counters[TAIL]) < size:
+                if deadline is not None and time.monotonic() > deadline:
+                    raise queue.Full
+                time.sleep(0.0002)
+            self.put(head, LENGTH.pack(len(payload)))
+            self.put(head + LENGTH.size, payload)
+            # Publish only after the bytes are in place
+            self.counters[HEAD] = head + size
+        self.items.release()
+
+    def recv(self, timeout=None, copy=True):
+        """Next message as bytes, or raise queue.Empty after timeout
+
+        With copy=False a message that doesn't wrap around the end of the
+        ring comes back as a memoryview straight into shared memory; it
+        stays valid until the next recv call.
+        """
+        self.release()
+        if not self.items.acquire(timeout=timeout):
+            raise queue.Empty
+        tail = self.counters[TAIL]
+        length = LENGTH.unpack(self.get(tail, LENGTH.size))[0]
+        start = (tail + LENGTH.size) % self.capacity
+        if not copy and start + length <= self.capacity:
+            self.pending = LENGTH.size + length
+            return self.data[start:start + length]
+        payload = self.get(tail + LENGTH.size, length)
+        self.counters[TAIL] = tail + LENGTH.size + length
+        return payload
+
+    def release(self):
+        """Hand the space behind the last zero-copy view back to writers"""
+        if self.pending:
+            self.counters[TAIL] = self.counters[TAIL] + self.pending
+            self.pending = 0
+
+    def close(self):
+        self.counters.release()
+        self.data.release()
+        self.shm.close()
+        if self.owner_pid == os.getpid():
+            self.shm.unlink()
+
+    def __del__(self):
+        # Drop our views first so SharedMemory can unmap cleanly at garbage collection
+        for view in ('counters', 'data'):
+            if hasattr(self, view):
+                getattr(self, view).release()
+
+
+def serve_system(factory, method, requests, replies):
+    """Child-process loop: build the system, answer each request until an empty message arrives"""
+    try:
+        handler = getattr(factory(), method)
+        while True:
+            message = requests.recv(copy=False)
+            stop = len(message) == 0
+            if not stop:
+                sequence = SEQUENCE.unpack_from(message)[0]
+                text = str(message[SEQUENCE.size:], 'utf-8')
+            if isinstance(message, memoryview):
+                message.release()  # wrapped messages arrive as bytes instead
+            if stop:
+                break
+            try:
+                reply = {'seq': sequence, 'ok': handler(text)}
+            except Exception as e:
+                reply = {'seq': sequence, 'error': f"{type(e).__name__}: {e}"}
+            replies.send(json.dumps(reply, default=str).encode('utf-8'))
+    finally:
+        requests.release()
+        requests.close()
+        replies.close()
+
+
+class RemoteSystem:
+    """A subsystem living in its own process, reached through a request ring and a reply ring"""
+
+    def __init__(self, name, factory, method='process_question', capacity=1 << 20, timeout=30.0):
+        ctx = multiprocessing.get_context()
+        self.name = name
+        self.timeout = timeout
+        self.requests = SharedRing(capacity, ctx=ctx)
+        self.replies = SharedRing(capacity, ctx=ctx)
+        self.lock = threading.Lock()
+        self.sequence = 0
+        self.process = ctx.Process(target=serve_system, args=(factory, method, self.requests, self.replies),
+                                   name=f"system-{name}", daemon=True)
+        self.process.start()
+
+    def request(self, message):
+        """Send a text message and wait for the system's reply"""
+        with self.lock:
+            self.sequence += 1
+            self.requests.send(SEQUENCE.pack(self.sequence) + str(message).encode('utf-8'), self.timeout)
+            deadline = time.monotonic() + self.timeout
+            while True:
+                try:
+                    reply = json.loads(self.replies.recv(0.1))
+                    # A late reply to a request that already timed out is not ours
+                    if reply['seq'] == self.sequence:
+                        break
+                except queue.Empty:
+                    if not self.process.is_alive():
+                        raise RuntimeError(f"{self.name}: system process exited ({self.process.exitcode})")
+                    if time.monotonic() > deadline:
+                        raise TimeoutError(f"{self.name}: no reply within {self.timeout}s")
+        if 'error' in reply:
+            raise RuntimeError(f"{self.name}: {reply['error']}")
+        return reply['ok']
+
+    def close(self):
+        if self.process.is_alive():
+            self.requests.send(b'', self.timeout)
+            self.process.join(self.timeout)
+        self.requests.close()
+        self.replies.close()
+
+
+class EchoSystem:
+    def process_question(self, message):
+        return message
+
+
+def benchmark_bus(messages=100000, size=256):
+    """Round trips per second to an echo system in another process"""
+    remote = RemoteSystem('echo', EchoSystem)
+    payload = 'x' * size
+    try:
+        start = time.time()
+        for _ in range(messages):
+            remote.request(payload)
+        elapsed = time.time() - start
+    finally:
+        remote.close()
+    print(f"📡 {messages} round trips of {size} bytes in {elapsed:.2f}s ({messages / elapsed:,.0f}/s)")
+    return elapsed
+
+
+if __name__ == "__main__":
+    benchmark_bus()
@@ -1,11 +1,14 @@
 # simple_start.py - Minimal working prototype
 import math
 import time
+from gematria import batch_gematria
+from query_profiler import profiled
 
 class SimpleDivineInterface:
     def __init__(self):
         self.golden_ratio = (1 + math.sqrt(5)) / 2
         
+    @profiled
     def ask_question(self, question):
         print(f"Question: {question}")
         print("Processing through sacred geometry...")
@@ -20,6 +23,10 @@ class SimpleDivineInterface:
         response = self.generate_response(sacred_number, question)
         return response
     
+    def sacred_numbers(self, questions):
+        """Sacred numbers for many questions at once (same formula as ask_question)"""
+        return (batch_gematria(questions, 'ordinal') * self.golden_ratio) % 1000
+    
     def generate_response(self, number, question):
         # Simple response algorithm - expand this
         responses = [
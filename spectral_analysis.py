@@ -0,0 +1,123 @@
+# spectral_analysis.py
+import numpy as np
+from numpy.lib.stride_tricks import sliding_window_view
+
+from frequency_analysis import SacredFrequencyTable
+
+
+class SpectralAnalyzer:
+    """Welch-averaged real FFT spectra mapped onto the sacred frequency table"""
+
+    def __init__(self, sacred_frequencies, sample_rate=2048, segment_length=512, overlap=0.5,
+                 frames_per_block=256):
+        self.sacred_frequencies = sacred_frequencies
+        self.sample_rate = sample_rate
+        self.segment_length = segment_length
+        self.step = max(1, int(segment_length * (1 - overlap)))
+        self.frames_per_block = frames_per_block
+
+        # Shared by every call: window, bin frequencies and the bin → sacred band map
+        self.window = np.hanning(segment_length)
+        self.window_power = np.sum(self.window ** 2)
+        self.freqs = np.fft.rfftfreq(segment_length, 1.0 / sample_rate)
+        self.table = SacredFrequencyTable(sacred_frequencies)
+        self.sacred = self.table.frequencies
+        nearest = self.table.nearest(self.freqs)
+        self.bands = (nearest[None, :] == self.sacred[:, None]).astype(np.float64)
+        self.bands[:, 0] = 0.0  # DC carries no sacred energy
+
+    def to_signal(self, data):
+        """Text becomes its UTF-8 byte values; numbers are used as-is"""
+        if isinstance(data, str):
+            return np.frombuffer(data.encode('utf-8'), dtype=np.uint8).astype(np.float64)
+        if isinstance(data, (int, float)):
+            return np.array([data], dtype=np.float64)
+        return np.asarray(data, dtype=np.float64).ravel()
+
+    def frame_power(self, frames):
+        """Windowed, mean-removed power spectrum of each row of a 2-D frame array"""
+        frames = frames - frames.mean(axis=1, keepdims=True)
+        spectrum = np.fft.rfft(frames * self.window, axis=1)
+        return (spectrum.real ** 2 + spectrum.imag ** 2) / (self.sample_rate * self.window_power)
+
+    def welch(self, chunks):
+        """Average the power spectrum over overlapping segments of a streamed signal
+
+        chunks is an iterable of signal pieces; only one block of frames is
+        held in memory at a time.
+        """
+        total = np.zeros(len(self.freqs))
+        segments = 0
+        carry = np.zeros(0)
+        block = self.segment_length + self.step * (self.frames_per_block - 1)
+
+        for chunk in chunks:
+            carry = np.concatenate([carry, self.to_signal(chunk)])
+            while len(carry) >= block:
+                frames = sliding_window_view(carry[:block], self.segment_length)[::self.step]
+                total += self.frame_power(frames).sum(axis=0)
+                segments += len(frames)
+                carry = carry[len(frames) * self.step:]
+
+        if len(carry) >= self.segment_length:
+            frames = sliding_window_view(carry, self.segment_length)[::self.step]
+            total += self.frame_power(frames).sum(axis=0)
+            segments += len(frames)
+        elif segments == 0 and len(carry):
+            # Short input: one zero-padded segment
+            padded = np.zeros((1, self.segment_length))
+            padded[0, :len(carry)] = carry - carry.mean()
+            total += self.frame_power(padded)[0]
+            segments = 1
+
+        return total / max(1, segments), segments
+
+    def summarize(self, psd, segments, top_k=3):
+        """Dominant components and the share of energy in each sacred band"""
+        ranked = np.argsort(psd[1:])[::-1][:top_k] + 1
+        total = psd[1:].sum()
+        band_energy = self.bands @ psd
+        dominant = []
+        for b in ranked:
+            if psd[b] <= 0:
+                continue
+            sacred = self.table.nearest_one(self.freqs[b])
+            dominant.append({
+                'frequency': float(self.freqs[b]),
+                'power': float(psd[b]),
+                'sacred_frequency': sacred,
+                'meaning': self.sacred_frequencies[sacred]
+            })
+        return {
+            'dominant': dominant,
+            'sacred_energy': {int(f): float(e / total) if total > 0 else 0.0
+                              for f, e in zip(self.sacred, band_energy)},
+            'segments': segments
+        }
+
+    def analyze(self, data, top_k=3):
+        """Spectrum of one input; iterators and generators are streamed chunk by chunk"""
+        if isinstance(data, (str, int, float, list, tuple, np.ndarray)):
+            data = [data]
+        psd, segments = self.welch(data)
+        return self.summarize(psd, segments, top_k)
+
+    def analyze_batch(self, inputs, top_k=3):
+        """Analyze many inputs; every short input goes through one shared rfft call"""
+        signals = [self.to_signal(x) for x in inputs]
+        results = [None] * len(signals)
+
+        short = [i for i, s in enumerate(signals) if len(s) <= self.segment_length]
+        if short:
+            frames = np.zeros((len(short), self.segment_length))
+            for row, i in enumerate(short):
+                if len(signals[i]):
+                    frames[row, :len(signals[i])] = signals[i] - signals[i].mean()
+            powers = self.frame_power(frames)
+            for row, i in enumerate(short):
+                results[i] = self.summarize(powers[row], 1, top_k)
+
+        for i, signal in enumerate(signals):
+            if results[i] is None:
+                results[i] = self.analyze(signal, top_k)
+        return results
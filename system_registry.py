@@ -0,0 +1,70 @@
+# system_registry.py
+import threading
+from collections.abc import Mapping
+
+
+class SystemRegistry(Mapping):
+    """Named subsystem factories; each system is built (and set up via on_create) on first access"""
+
+    def __init__(self, on_create=None):
+        self.on_create = on_create
+        self.factories = {}
+        self.systems = {}
+        self.failures = {}
+        self.locks = {}
+        self.lock = threading.Lock()
+
+    def register(self, name, factory):
+        with self.lock:
+            self.factories[name] = factory
+            self.locks[name] = threading.Lock()
+        return self
+
+    def __getitem__(self, name):
+        system = self.systems.get(name)
+        if system is not None:
+            return system
+        if name not in self.factories:
+            raise KeyError(name)
+        # Per-system lock: a caller racing the pre-warm thread waits for that one system only
+        with self.locks[name]:
+            system = self.systems.get(name)
+            if system is None:
+                system = self.factories[name]()
+                if self.on_create is not None:
+                    self.on_create(name, system)
+                self.systems[name] = system
+                self.failures.pop(name, None)
+        return system
+
+    def __iter__(self):
+        return iter(list(self.factories))
+
+    def __len__(self):
+        return len(self.factories)
+
+    def is_ready(self, name):
+        return name in self.systems
+
+    def ready(self):
+        """The systems created so far, without creating any more"""
+        return dict(self.systems)
+
+    def prewarm(self, names=None, background=True):
+        """Create the named (default: all) systems ahead of use, optionally on a daemon thread"""
+        names = list(self.factories) if names is None else list(names)
+
+        def warm():
+            for name in names:
+                try:
+                    self[name]
+                except Exception as e:
+                    # Left uncreated; the next direct access retries and raises to its caller
+                    self.failures[name] = e
+
+        if not background:
+            warm()
+            return None
+        thread = threading.Thread(target=warm, name="system-prewarm", daemon=True)
+        thread.start()
+        return thread
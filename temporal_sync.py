@@ -1,25 +1,134 @@
 # temporal_sync.py
+import threading
 import time
+import zlib
+from collections import deque
+from concurrent.futures import Future
+
+import numpy as np
 
 class TemporalSynchronizer:
-    def __init__(self):
-        self.time_slices = 12
+    """12 temporal slices as a fair scheduler: one queue per slice, weighted round-robin dispatch"""
+
+    def __init__(self, time_slices=12, weights=None, wait_window=1024):
+        self.time_slices = time_slices
         self.sync_points = []
-        
+        # Weight = how many queued items a slice may dispatch per round
+        self.weights = list(weights) if weights is not None else [1] * time_slices
+        self.queues = [deque() for _ in range(time_slices)]
+        self.condition = threading.Condition()
+        self.current = 0
+        self.credit = self.weights[0]
+        self.running = False
+        self.dispatchers = []
+        self.resonance_field = None  # stepped once per scheduling round when attached
+
+        self.enqueued = [0] * time_slices
+        self.completed = [0] * time_slices
+        self.dispatch_errors = 0
+        self.waits = [deque(maxlen=wait_window) for _ in range(time_slices)]
+
     def synchronize_all(self, systems):
         # For now, we'll just print a message
         print("Synchronizing systems across time slices...")
         for time_slice in range(self.time_slices):
             self.sync_points.append(time_slice)
         print(f"Synced {len(systems)} systems across {self.time_slices} time slices.")
-        
+
     def is_synchronized(self):
         return len(self.sync_points) == self.time_slices
 
+    def slice_for(self, tenant):
+        """Stable tenant → slice mapping, so each tenant's questions share one queue"""
+        return zlib.crc32(str(tenant).encode('utf-8')) % self.time_slices
+
+    def set_weight(self, time_slice, weight):
+        with self.condition:
+            self.weights[time_slice] = max(1, int(weight))
+
+    def submit(self, fn, *args, tenant=None, time_slice=None):
+        """Queue fn(*args) on a slice (explicit, by tenant, or least loaded); returns a Future"""
+        future = Future()
+        with self.condition:
+            if time_slice is None:
+                time_slice = (self.slice_for(tenant) if tenant is not None
+                              else min(range(self.time_slices), key=lambda s: len(self.queues[s])))
+            self.queues[time_slice].append((fn, args, future, time.monotonic()))
+            self.enqueued[time_slice] += 1
+            self.condition.notify()
+        return future
+
+    def next_item(self, timeout=None):
+        """Deficit round-robin: take up to weight items from a slice, then move on to the next"""
+        with self.condition:
+            if not any(self.queues):
+                self.condition.wait(timeout)
+                if not any(self.queues):
+                    return None
+            while True:
+                queue = self.queues[self.current]
+                if queue and self.credit > 0:
+                    self.credit -= 1
+                    return (self.current,) + queue.popleft()
+                self.current = (self.current + 1) % self.time_slices
+                self.credit = self.weights[self.current]
+                if self.current == 0 and self.resonance_field is not None:
+                    self.resonance_field.step()
+
+    def dispatch_loop(self):
+        while self.running:
+            try:
+                item = self.next_item(timeout=0.5)
+            except Exception as e:
+                # A failing field step must not take down the dispatcher and strand every queued Future
+                self.dispatch_errors += 1
+                print(f"⚠️ Temporal dispatch error: {type(e).__name__}: {e}")
+                continue
+            if item is None:
+                continue
+            time_slice, fn, args, future, queued_at = item
+            if not future.set_running_or_notify_cancel():
+                continue
+            self.waits[time_slice].append(time.monotonic() - queued_at)
+            try:
+                future.set_result(fn(*args))
+            except Exception as e:
+                future.set_exception(e)
+            self.completed[time_slice] += 1
+
+    def start(self, workers=1):
+        """Start dispatcher threads that drain the slice queues"""
+        self.running = True
+        for i in range(workers):
+            thread = threading.Thread(target=self.dispatch_loop, name=f"temporal-dispatch-{i}", daemon=True)
+            thread.start()
+            self.dispatchers.append(thread)
+
+    def stop(self):
+        self.running = False
+        with self.condition:
+            self.condition.notify_all()
+        for thread in self.dispatchers:
+            thread.join()
+        self.dispatchers = []
+
+    def stats(self):
+        """Per-slice queue depth, throughput counters and wait times (ms) over the recent window"""
+        with self.condition:
+            depths = [len(q) for q in self.queues]
+            waits = [np.array(w) * 1e3 for w in self.waits]
+        return [{
+            'time_slice': s,
+            'weight': self.weights[s],
+            'queue_depth': depths[s],
+            'enqueued': self.enqueued[s],
+            'completed': self.completed[s],
+            'wait_ms_mean': float(waits[s].mean()) if len(waits[s]) else 0.0,
+            'wait_ms_p95': float(np.percentile(waits[s], 95)) if len(waits[s]) else 0.0,
+            'wait_ms_max': float(waits[s].max()) if len(waits[s]) else 0.0,
+        } for s in range(self.time_slices)]
+
     def maintain_temporal_coherence(self):
-        # We'll implement a simple coherence maintenance
-        while True:
-            for time_slice in range(self.time_slices):
-                # In a real system, we would check and recalibrate each time slice
-                pass
-            time.sleep(1)
+        # Background thread body: dispatch queued work slice by slice, forever
+        self.running = True
+        self.dispatch_loop()
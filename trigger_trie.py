@@ -0,0 +1,64 @@
+# trigger_trie.py
+import re
+
+
+class TriggerTrie:
+    """Token trie over single- and multi-word triggers
+
+    With prefix_match, a trigger's last word also matches any longer word it
+    starts, so 'color' catches 'colors' and 'rain' catches 'raining', which
+    is what substring checks did.
+    """
+
+    def __init__(self, prefix_match=False):
+        self.root = {}
+        self.prefix_match = prefix_match
+        self.longest = 0
+        self.shortest_token = None
+        self.size = 0
+
+    @staticmethod
+    def tokenize(text):
+        return re.findall(r"[a-z0-9]+", text.lower())
+
+    def add(self, trigger, payload, rank):
+        """Register a trigger phrase; lower rank wins when several triggers match"""
+        tokens = self.tokenize(trigger)
+        if not tokens:
+            return
+        node = self.root
+        for token in tokens:
+            node = node.setdefault(token, {})
+        # None is never a token, so it can mark the end of a trigger
+        current = node.get(None)
+        if current is None or rank < current[0]:
+            node[None] = (rank, payload)
+        self.longest = max(self.longest, len(tokens))
+        if self.shortest_token is None or len(tokens[-1]) < self.shortest_token:
+            self.shortest_token = len(tokens[-1])
+        self.size += 1
+
+    def best_match(self, text):
+        """Scan the text once and return the payload of the best-ranked trigger, or None"""
+        tokens = self.tokenize(text)
+        best = None
+        for start in range(len(tokens)):
+            node = self.root
+            # Each walk is bounded by the longest trigger, not by the number of facts
+            for token in tokens[start:start + self.longest]:
+                hits = []
+                if self.prefix_match:
+                    # Triggers ending in a proper prefix of this token ("color" → "colors")
+                    for end in range(self.shortest_token, len(token)):
+                        stem = node.get(token[:end])
+                        if stem is not None and None in stem:
+                            hits.append(stem[None])
+                node = node.get(token)
+                if node is not None and None in node:
+                    hits.append(node[None])
+                for hit in hits:
+                    if best is None or hit[0] < best[0]:
+                        best = hit
+                if node is None:
+                    break
+        return best[1] if best is not None else None
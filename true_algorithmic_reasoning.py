@@ -5,6 +5,7 @@ import re
 import math
 import numpy as np
 from collections import defaultdict
+from query_profiler import profiled
 
 print("🧠 BUILDING TRUE ALGORITHMIC REASONING ENGINE...")
 
@@ -270,6 +271,7 @@ class TrueReasoningEngine:
         self.session_count = 0
         self.learning_mode = True
         
+    @profiled
     def process(self, query):
         """Process query with true algorithmic reasoning"""
         self.session_count += 1
@@ -0,0 +1,263 @@
+# worker_pool.py
+import multiprocessing
+import os
+import threading
+import time
+from collections import deque
+from concurrent.futures import Future
+from multiprocessing.connection import wait
+
+
+class WorkerCrashed(RuntimeError):
+    pass
+
+
+class Prebuilt:
+    """Factory returning an object built once in the parent (inherited by forked workers)"""
+
+    def __init__(self, instance):
+        self.instance = instance
+
+    def __call__(self):
+        return self.instance
+
+
+def worker_main(factory, method, conn):
+    try:
+        handler = getattr(factory(), method)
+    except Exception as e:
+        conn.send(('failed', f"{type(e).__name__}: {e}"))
+        return
+    conn.send(('ready', None))
+    while True:
+        try:
+            request = conn.recv()
+        except EOFError:
+            break
+        if request is None:
+            break
+        try:
+            conn.send(('ok', handler(request)))
+        except Exception as e:
+            conn.send(('error', f"{type(e).__name__}: {e}"))
+
+
+class Worker:
+    def __init__(self, ctx, factory, method):
+        self.conn, child = ctx.Pipe()
+        self.process = ctx.Process(target=worker_main, args=(factory, method, child), daemon=True)
+        self.process.start()
+        child.close()
+        self.ready = False
+        self.served = 0
+        self.future = None
+        self.deadline = None
+
+    def stop(self, grace=1.0):
+        try:
+            self.conn.send(None)
+        except (BrokenPipeError, OSError):
+            pass
+        self.process.join(grace)
+        if self.process.is_alive():
+            self.process.kill()
+            self.process.join()
+        self.conn.close()
+
+
+class WorkerPool:
+    """Pre-forked worker processes, each holding one fully initialized system, fed by a dispatcher thread
+
+    A request that overruns its timeout (counted from submit) kills only its
+    worker; a crashed worker fails only its own request. Either way, and
+    after max_requests answers, the worker is replaced. Workers that keep
+    dying before they are ready are retried with backoff, and after
+    max_startup_failures in a row the pool gives up and fails every
+    pending request.
+    """
+
+    def __init__(self, factory, method='ask_question', workers=None, max_requests=500, timeout=30.0,
+                 preload=True, ctx=None, max_startup_failures=5):
+        self.ctx = ctx or multiprocessing.get_context()
+        self.method = method
+        self.max_requests = max_requests
+        self.timeout = timeout
+        self.size = workers or os.cpu_count() or 1
+        # With fork, build the system once here and let every worker inherit it copy-on-write
+        if preload and self.ctx.get_start_method() == 'fork':
+            factory = Prebuilt(factory())
+        self.factory = factory
+
+        self.pending = deque()
+        self.lock = threading.Lock()
+        self.wake_reader, self.wake_writer = self.ctx.Pipe(duplex=False)
+        self.closed = False
+        self.broken = None  # set to the startup error once the pool gives up
+        self.max_startup_failures = max_startup_failures
+        self.startup_failures = 0
+        self.stats = {'completed': 0, 'errors': 0, 'timeouts': 0, 'crashes': 0, 'recycled': 0}
+
+        self.workers = [Worker(self.ctx, self.factory, self.method) for _ in range(self.size)]
+        self.dispatcher = threading.Thread(target=self.dispatch, name="worker-pool-dispatcher", daemon=True)
+        self.dispatcher.start()
+
+    def submit(self, request, timeout=None):
+        """Queue one request; returns a Future for its result"""
+        future = Future()
+        with self.lock:
+            if self.broken is not None:
+                raise WorkerCrashed(f"Worker pool gave up: {self.broken}")
+            if self.closed:
+                raise RuntimeError("Worker pool is closed")
+            deadline = time.monotonic() + (self.timeout if timeout is None else timeout)
+            self.pending.append((request, future, deadline))
+        self.wake_writer.send_bytes(b'')
+        return future
+
+    def ask(self, request, timeout=None):
+        return self.submit(request, timeout).result()
+
+    def map(self, requests, timeout=None):
+        futures = [self.submit(r, timeout) for r in requests]
+        return [f.result() for f in futures]
+
+    def replace(self, index, reason):
+        self.stats[reason] += 1
+        self.workers[index].stop(grace=0.0 if reason != 'recycled' else 1.0)
+        self.workers[index] = Worker(self.ctx, self.factory, self.method)
+
+    def assign(self):
+        for worker in self.workers:
+            if not worker.ready or worker.future is not None:
+                continue
+            with self.lock:
+                if not self.pending:
+                    return
+                request, future, deadline = self.pending.popleft()
+            if not future.set_running_or_notify_cancel():
+                continue
+            worker.future = future
+            worker.deadline = deadline
+            worker.conn.send(request)
+
+    def expire_pending(self):
+        """Fail queued requests whose deadline passed before any worker took them; returns the next deadline"""
+        now = time.monotonic()
+        with self.lock:
+            expired = [item for item in self.pending if item[2] <= now]
+            if expired:
+                self.pending = deque(item for item in self.pending if item[2] > now)
+            upcoming = min((item[2] for item in self.pending), default=None)
+        for _, future, _ in expired:
+            if future.set_running_or_notify_cancel():
+                self.stats['timeouts'] += 1
+                future.set_exception(TimeoutError("No worker answered within the request timeout"))
+        return upcoming
+
+    def give_up(self, reason):
+        """Stop respawning and fail everything still queued"""
+        with self.lock:
+            self.broken = reason
+            self.closed = True
+            pending, self.pending = self.pending, deque()
+        for _, future, _ in pending:
+            if future.set_running_or_notify_cancel():
+                future.set_exception(WorkerCrashed(f"Worker pool gave up: {reason}"))
+
+    def dispatch(self):
+        while True:
+            with self.lock:
+                if self.closed and not self.pending and all(w.future is None for w in self.workers):
+                    break
+            if self.broken is not None:
+                for worker in self.workers:
+                    if worker.future is not None:
+                        worker.future.set_exception(WorkerCrashed(f"Worker pool gave up: {self.broken}"))
+                        worker.future = None
+                break
+            self.assign()
+            upcoming = self.expire_pending()
+
+            busy = [w for w in self.workers if w.future is not None]
+            deadlines = [w.deadline for w in busy] + ([upcoming] if upcoming is not None else [])
+            wait_for = max(0.0, min(deadlines) - time.monotonic()) if deadlines else None
+            ready = wait([self.wake_reader] + [w.conn for w in self.workers], wait_for)
+
+            if self.wake_reader in ready:
+                while self.wake_reader.poll():
+                    self.wake_reader.recv_bytes()
+
+            for i, worker in enumerate(self.workers):
+                if worker.conn in ready:
+                    self.collect(i, worker)
+                elif worker.future is not None and time.monotonic() > worker.deadline:
+                    worker.future.set_exception(TimeoutError("No answer within the request timeout"))
+                    self.replace(i, 'timeouts')
+
+        for worker in self.workers:
+            worker.stop()
+
+    def collect(self, index, worker):
+        try:
+            status, value = worker.conn.recv()
+        except (EOFError, OSError):
+            worker.process.join(1.0)
+            if not worker.ready:
+                self.startup_failed(index, f"worker exited with code {worker.process.exitcode} before it was ready")
+                return
+            if worker.future is not None:
+                worker.future.set_exception(WorkerCrashed(f"Worker exited with code {worker.process.exitcode}"))
+            self.replace(index, 'crashes')
+            return
+
+        if status == 'failed':
+            self.startup_failed(index, value)
+            return
+        if status == 'ready':
+            worker.ready = True
+            self.startup_failures = 0
+            return
+        future, worker.future = worker.future, None
+        if status == 'ok':
+            self.stats['completed'] += 1
+            future.set_result(value)
+        else:
+            self.stats['errors'] += 1
+            future.set_exception(RuntimeError(value))
+        worker.served += 1
+        if worker.served >= self.max_requests:
+            self.replace(index, 'recycled')
+
+    def startup_failed(self, index, reason):
+        """A worker died while building its system: back off and retry, or give up after too many"""
+        self.startup_failures += 1
+        if self.startup_failures >= self.max_startup_failures:
+            self.stats['crashes'] += 1
+            self.give_up(f"{self.startup_failures} workers in a row failed to start ({reason})")
+            return
+        # Short, capped backoff; it only stalls the dispatcher while workers can't start at all
+        time.sleep(min(0.05 * 2 ** (self.startup_failures - 1), 1.0))
+        self.replace(index, 'crashes')
+
+    def close(self, wait=True):
+        """Finish queued requests, then stop every worker"""
+        with self.lock:
+            self.closed = True
+        self.wake_writer.send_bytes(b'')
+        if wait:
+            self.dispatcher.join()
+
+
+def benchmark_pool(factory, requests, method='ask_question', worker_counts=(1, None)):
+    """Requests per second for each pool size (None = one worker per core)"""
+    results = {}
+    for workers in worker_counts:
+        pool = WorkerPool(factory, method, workers)
+        pool.map(requests[:pool.size])  # let every worker finish warming up
+        start = time.time()
+        pool.map(requests)
+        elapsed = time.time() - start
+        pool.close()
+        results[pool.size] = len(requests) / elapsed
+        print(f"⚙️  {pool.size} workers: {results[pool.size]:,.1f} requests/s")
+    return results
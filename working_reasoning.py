@@ -1,12 +1,68 @@
 # working_reasoning.py
 import re
 import math
+from trigger_trie import TriggerTrie
 
 print("🧠 BUILDING MINIMAL WORKING REASONING ENGINE...")
 
+# Bump when the reasoning logic changes, so memoized answers from older code are not served
+ENGINE_VERSION = 1
+
+class TrackedDict(dict):
+    """dict that counts every change to itself or to the TrackedDicts nested in it"""
+    # Class defaults cover unpickling, which restores items before instance attributes
+    revision = 0
+    parent = None
+    
+    def __init__(self, *args, **kwargs):
+        super().__init__()
+        self.revision = 0
+        self.parent = None
+        self.update(*args, **kwargs)
+    
+    def changed(self):
+        self.revision += 1
+        if self.parent is not None:
+            self.parent.changed()
+    
+    def __setitem__(self, key, value):
+        if isinstance(value, dict):
+            value = value if isinstance(value, TrackedDict) else TrackedDict(value)
+            value.parent = self
+        super().__setitem__(key, value)
+        self.changed()
+    
+    def __delitem__(self, key):
+        super().__delitem__(key)
+        self.changed()
+    
+    def update(self, *args, **kwargs):
+        for key, value in dict(*args, **kwargs).items():
+            self[key] = value
+    
+    def setdefault(self, key, default=None):
+        if key not in self:
+            self[key] = default
+        return self[key]
+    
+    def pop(self, key, *default):
+        value = super().pop(key, *default)
+        self.changed()
+        return value
+    
+    def popitem(self):
+        item = super().popitem()
+        self.changed()
+        return item
+    
+    def clear(self):
+        super().clear()
+        self.changed()
+
 class WorkingReasoner:
-    def __init__(self):
-        self.knowledge = {
+    def __init__(self, memo=None):
+        # Tracked so that any edit, including direct assignment, re-stamps memoized answers
+        self.knowledge = TrackedDict({
             'math': {
                 'addition': lambda a, b: a + b,
                 'subtraction': lambda a, b: a - b,
@@ -24,7 +80,48 @@ class WorkingReasoner:
                 'umbrella_rain': "If it's raining, an umbrella keeps you dry. Therefore, bringing one is logical.",
                 'learning': "Learning valuable skills generally improves career opportunities and problem-solving ability"
             }
-        }
+        })
+        
+        # Trigger phrases for each fact, in priority order
+        self.triggers = [
+            ('Scientific fact', 'facts', 'sky_blue', ['sky', 'blue', 'color', 'colour']),
+            ('Biological fact', 'facts', 'breathing_underwater', ['breathe', 'breathing', 'underwater']),
+            ('Chemical fact', 'facts', 'vinegar_baking_soda', ['vinegar', 'baking soda']),
+            ('Astronomical fact', 'facts', 'seasons', ['season', 'seasons', 'summer', 'winter']),
+            ('Practical advice', 'facts', 'python_value', ['learn python', 'python programming']),
+            ('Logical reasoning', 'logic', 'umbrella_rain', ['umbrella', 'rain', 'rains', 'raining']),
+            ('Logical reasoning', 'logic', 'learning', ['should i learn', 'should i study'])
+        ]
+        self.trigger_index = TriggerTrie(prefix_match=True)
+        for rank, (label, section, key, phrases) in enumerate(self.triggers):
+            for phrase in phrases:
+                self.trigger_index.add(phrase, (label, section, key), rank)
+        
+        # Optional persistent answer cache (see answer_memo.AnswerMemoStore)
+        self.memo = memo
+        self.memo_stamp = None
+        self.stamped_revision = None
+    
+    def add_fact(self, label, section, key, text, phrases):
+        """Teach a new fact; it ranks below every existing trigger"""
+        self.knowledge.setdefault(section, {})[key] = text
+        rank = len(self.triggers)
+        self.triggers.append((label, section, key, list(phrases)))
+        for phrase in phrases:
+            self.trigger_index.add(phrase, (label, section, key), rank)
+    
+    def current_memo_stamp(self):
+        """Stamp for memoized answers, recomputed whenever the knowledge has changed"""
+        revision = (self.knowledge.revision, len(self.triggers))
+        if revision != self.stamped_revision:
+            # Every text section; 'math' holds lambdas, which are code rather than knowledge
+            sections = {name: facts for name, facts in self.knowledge.items() if name != 'math'}
+            self.memo_stamp = self.memo.version_stamp(f'WorkingReasoner/v{ENGINE_VERSION}', {
+                'knowledge': sections,
+                'triggers': self.triggers
+            })
+            self.stamped_revision = revision
+        return self.memo_stamp
     
     def extract_math(self, text):
         """Actually extract and solve math problems"""
@@ -57,35 +154,30 @@ class WorkingReasoner:
     
     def answer_question(self, question):
         """Actually answer questions based on knowledge"""
-        question_lower = question.lower()
+        if self.memo is not None:
+            stamp = self.current_memo_stamp()
+            cached = self.memo.get(question, stamp)
+            if cached is not None:
+                return cached
+        
+        answer = self.compute_answer(question)
         
+        if self.memo is not None:
+            self.memo.put(question, stamp, answer)
+        return answer
+    
+    def compute_answer(self, question):
+        """Reason from the knowledge base without consulting the memo store"""
         # Math questions
         math_answer = self.extract_math(question)
         if math_answer:
             return f"Mathematical answer: {math_answer}"
         
-        # Fact-based questions
-        if any(word in question_lower for word in ['sky', 'blue', 'color']):
-            return f"Scientific fact: {self.knowledge['facts']['sky_blue']}"
-        
-        elif any(word in question_lower for word in ['breathe', 'underwater']):
-            return f"Biological fact: {self.knowledge['facts']['breathing_underwater']}"
-        
-        elif any(word in question_lower for word in ['vinegar', 'baking soda']):
-            return f"Chemical fact: {self.knowledge['facts']['vinegar_baking_soda']}"
-        
-        elif any(word in question_lower for word in ['season', 'summer', 'winter']):
-            return f"Astronomical fact: {self.knowledge['facts']['seasons']}"
-        
-        elif any(word in question_lower for word in ['learn python', 'python programming']):
-            return f"Practical advice: {self.knowledge['facts']['python_value']}"
-        
-        # Logic questions
-        elif any(word in question_lower for word in ['umbrella', 'rain']):
-            return f"Logical reasoning: {self.knowledge['logic']['umbrella_rain']}"
-        
-        elif any(word in question_lower for word in ['should i learn', 'should i study']):
-            return f"Logical reasoning: {self.knowledge['logic']['learning']}"
+        # Fact-based and logic questions: one pass over the question through the trigger trie
+        match = self.trigger_index.best_match(question)
+        if match:
+            label, section, key = match
+            return f"{label}: {self.knowledge[section][key]}"
         
         # Default responses for unknown questions
         if '?' in question:
@@ -118,6 +210,30 @@ def test_engine():
         answer = reasoner.answer_question(question)
         print(f"   A: {answer}")
 
+def test_inflected_triggers():
+    """Regression check: inflected questions match the same fact as the original substring checks"""
+    reasoner = WorkingReasoner()
+    expected = {
+        "What makes rainbow colors?": 'sky_blue',
+        "Why are skies blueish at noon?": 'sky_blue',
+        "Is it hard breathing underwater?": 'breathing_underwater',
+        "Can fish breathes underwaters?": 'breathing_underwater',
+        "Are baking sodas and vinegars reactive?": 'vinegar_baking_soda',
+        "Why do seasons change?": 'seasons',
+        "Why are summers hot?": 'seasons',
+        "Is learn pythonic style worth it?": 'python_value',
+        "Will it keep raining all day?": 'umbrella_rain',
+        "Should I take umbrellas when it rained?": 'umbrella_rain',
+        "Should I study harder?": 'learning',
+    }
+    failures = []
+    for question, key in expected.items():
+        match = reasoner.trigger_index.best_match(question)
+        if match is None or match[2] != key:
+            failures.append(f"{question!r}: expected {key}, got {match}")
+    assert not failures, "\n".join(failures)
+    print(f"✅ {len(expected)} inflected questions matched their facts")
+
 def interactive_mode():
     """Let users ask their own questions"""
     reasoner = WorkingReasoner()
@@ -149,5 +265,6 @@ if __name__ == "__main__":
     
     if choice == "1":
         test_engine()
+        test_inflected_triggers()
     else:
         interactive_mode()